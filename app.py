@@ -14,6 +14,7 @@ import streamlit as st
 import sys
 import os
 import hashlib
+import logging
 import tempfile
 from datetime import datetime
 from pathlib import Path
@@ -23,6 +24,12 @@ from dateutil.relativedelta import relativedelta
 project_root = os.path.dirname(os.path.abspath(__file__))
 sys.path.insert(0, project_root)
 
+# Route library warnings (e.g. database load failures) to stderr
+logging.basicConfig(
+    level=logging.WARNING,
+    format="%(asctime)s %(levelname)s %(name)s: %(message)s"
+)
+
 # Import logic calculators
 from logic import (
     FinancialFoundation,
@@ -35,7 +42,7 @@ from logic import (
 
 # Import UI components
 from components import (
-    get_custom_css,
+    inject_css,
     render_header,
     render_net_worth_summary,
     render_section_header,
@@ -50,7 +57,7 @@ from components import (
 )
 
 # Import sample data
-from data import get_all_sample_clients, get_historical_expenses
+from data import get_all_sample_clients, get_historical_expenses, clear_client_cache
 
 # Import database functions for profile management
 from database.db import (
@@ -215,6 +222,7 @@ def render_personal_info_tab(client_id: str, client_data):
                     'state': state
                 }
                 update_client_profile(client_id, update_data)
+                clear_client_cache()
                 st.success("✅ Profile updated successfully!")
                 st.rerun()
             except Exception as e:
@@ -600,7 +608,7 @@ st.set_page_config(
 )
 
 # Apply custom CSS
-st.markdown(get_custom_css(), unsafe_allow_html=True)
+inject_css()
 
 
 def main():
@@ -613,10 +621,10 @@ def main():
             <h2 style="color: #059669; margin: 0; font-size: 1.25rem;">WealthView</h2>
             <p style="color: #64748B; font-size: 0.75rem; margin-top: 0.25rem;">Financial Advisory Platform</p>
         </div>
+        <p style="font-size: 0.875rem; color: #475569; margin-bottom: 0.5rem;">Select Client</p>
         """, unsafe_allow_html=True)
         
         # Client selector
-        st.markdown("<p style='font-size: 0.875rem; color: #475569; margin-bottom: 0.5rem;'>Select Client</p>", unsafe_allow_html=True)
         clients = get_all_sample_clients()
         client_options = {
             f"{data.profile.name} ({cid})": cid 
@@ -654,13 +662,11 @@ def main():
                 </div>
             </div>
         </div>
+        <div style="height: 1.5rem;"></div>
+        <p style="font-size: 0.7rem; color: #475569; text-transform: uppercase; letter-spacing: 0.05em; margin-bottom: 0.75rem;">Navigation</p>
         """, unsafe_allow_html=True)
         
-        st.markdown("<div style='height: 1.5rem;'></div>", unsafe_allow_html=True)
-        
         # Navigation with clickable cards
-        st.markdown("<p style='font-size: 0.7rem; color: #475569; text-transform: uppercase; letter-spacing: 0.05em; margin-bottom: 0.75rem;'>Navigation</p>", unsafe_allow_html=True)
-        
         # Initialize session state for selected section
         if 'selected_section' not in st.session_state:
             st.session_state.selected_section = "Overview"
@@ -688,8 +694,8 @@ def main():
         
         selected_section = st.session_state.selected_section
         
-        st.markdown("<div style='height: 2rem;'></div>", unsafe_allow_html=True)
         st.markdown("""
+        <div style="height: 2rem;"></div>
         <div style="font-size: 0.7rem; color: #475569; text-align: center;">
             Dashboard v1.0
         </div>
@@ -1201,6 +1207,17 @@ def render_planning_section(summary, planning_calc, client_data):
     st.markdown("<div style='height: 2rem;'></div>", unsafe_allow_html=True)
     
     # Scenario analysis
+    render_scenario_analysis(planning_calc)
+
+
+@st.fragment
+def render_scenario_analysis(planning_calc):
+    """
+    Render the What-If scenario controls and result.
+    
+    Runs as a fragment so moving a slider only reruns this block instead of
+    the whole dashboard and its charts.
+    """
     st.markdown("""
     <div style="margin-bottom: 1rem;">
         <h3 style="font-size: 1.125rem; font-weight: 600; color: #1E293B; margin: 0; letter-spacing: -0.01em;">What-If Scenarios</h3>
@@ -2,11 +2,12 @@
 Components module initialization.
 """
 
-from .styles import get_custom_css, get_status_color, get_status_class
+from .styles import get_custom_css, inject_css, get_status_color, get_status_class
 from .ui_components import (
     render_header,
     render_net_worth_summary,
     render_section_header,
+    metric_card_html,
     render_metric_card,
     render_metric_grid,
     render_allocation_chart,
@@ -15,17 +16,20 @@ from .ui_components import (
     render_retirement_projection_chart,
     render_asset_breakdown_chart,
     render_health_score_gauge,
+    render_section_html,
     render_section_container_start,
     render_section_container_end
 )
 
 __all__ = [
     'get_custom_css',
+    'inject_css',
     'get_status_color',
     'get_status_class',
     'render_header',
     'render_net_worth_summary',
     'render_section_header',
+    'metric_card_html',
     'render_metric_card',
     'render_metric_grid',
     'render_allocation_chart',
@@ -34,6 +38,7 @@ __all__ = [
     'render_retirement_projection_chart',
     'render_asset_breakdown_chart',
     'render_health_score_gauge',
+    'render_section_html',
     'render_section_container_start',
     'render_section_container_end'
 ]
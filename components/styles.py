@@ -3,658 +3,806 @@ Custom CSS styles for the Financial Advisor Dashboard.
 Professional light theme with green and black accents.
 """
 
-def get_custom_css() -> str:
-    """Return custom CSS for the dashboard."""
-    return """
-    <style>
-    /* ===== GLOBAL STYLES ===== */
-    @import url('https://fonts.googleapis.com/css2?family=Inter:wght@300;400;500;600;700&display=swap');
-    
-    :root {
-        --bg-primary: #FAF9F6;
-        --bg-secondary: #F5F4F0;
-        --bg-card: #FFFFFF;
-        --bg-card-hover: #F5F4F0;
-        --text-primary: #1E293B;
-        --text-secondary: #475569;
-        --text-muted: #64748B;
-        --accent-green: #059669;
-        --accent-green-light: #10B981;
-        --accent-green-dark: #047857;
-        --accent-gold: #D97706;
-        --accent-gold-light: #F59E0B;
-        --status-excellent: #059669;
-        --status-good: #0284C7;
-        --status-fair: #D97706;
-        --status-poor: #EA580C;
-        --status-critical: #DC2626;
-        --border-color: #E2E8F0;
-        --border-color-dark: #CBD5E1;
-        --shadow: 0 1px 3px rgba(0, 0, 0, 0.1), 0 1px 2px rgba(0, 0, 0, 0.06);
-        --shadow-lg: 0 4px 6px -1px rgba(0, 0, 0, 0.1), 0 2px 4px -1px rgba(0, 0, 0, 0.06);
-    }
-    
-    .stApp {
-        font-family: 'Inter', -apple-system, BlinkMacSystemFont, sans-serif;
-        background-color: var(--bg-primary) !important;
-    }
-    
-    /* Hide the black header bar */
-    header[data-testid="stHeader"] {
-        background-color: var(--bg-primary) !important;
-        border-bottom: none !important;
-    }
-    
-    /* Force beige background on all main areas */
-    .stApp > header + div {
-        background-color: var(--bg-primary) !important;
-    }
-    
-    [data-testid="stAppViewContainer"] {
-        background-color: var(--bg-primary) !important;
-    }
-    
-    [data-testid="stMain"] {
-        background-color: var(--bg-primary) !important;
-    }
-    
-    .main {
-        background-color: var(--bg-primary) !important;
-    }
-    
-    /* ===== HIDE STREAMLIT BRANDING ===== */
-    #MainMenu {visibility: hidden;}
-    footer {visibility: hidden;}
-    header {background-color: var(--bg-primary) !important;}
-    
-    /* ===== MAIN CONTAINER ===== */
-    .main .block-container {
-        padding: 2rem 3rem;
-        max-width: 1400px;
-        background-color: var(--bg-primary);
-    }
-    
-    /* ===== HEADER STYLES ===== */
-    .dashboard-header {
-        background: #FFFFFF;
-        padding: 2rem 2.5rem;
-        border-radius: 16px;
-        margin-bottom: 2rem;
-        border: 1px solid var(--border-color);
-        box-shadow: var(--shadow-lg);
-    }
-    
-    .dashboard-title {
-        font-size: 2rem;
-        font-weight: 700;
-        color: var(--accent-green);
-        margin: 0;
-        letter-spacing: -0.02em;
-    }
-    
-    .dashboard-subtitle {
-        display: none;
-    }
-    
-    .client-badge {
-        display: inline-flex;
-        align-items: center;
-        gap: 0.5rem;
-        background: rgba(5, 150, 105, 0.1);
-        color: var(--accent-green);
-        padding: 0.5rem 1rem;
-        border-radius: 9999px;
-        font-size: 0.875rem;
-        font-weight: 600;
-        margin-top: 1rem;
-        border: 1px solid rgba(5, 150, 105, 0.2);
-    }
-    
-    /* ===== SECTION STYLES ===== */
-    .section-container {
-        background: var(--bg-card);
-        border-radius: 16px;
-        padding: 1.5rem;
-        margin-bottom: 1.5rem;
-        border: 1px solid var(--border-color);
-        box-shadow: var(--shadow);
-        transition: all 0.2s ease;
-    }
-    
-    .section-container:hover {
-        border-color: var(--accent-green);
-        box-shadow: var(--shadow-lg);
-    }
-    
-    .section-header {
-        display: flex;
-        justify-content: space-between;
-        align-items: center;
-        margin-bottom: 1.5rem;
-        padding-bottom: 1rem;
-        border-bottom: 1px solid var(--border-color);
-    }
-    
-    .section-title {
-        font-size: 1.25rem;
-        font-weight: 600;
-        color: var(--text-primary);
-        margin: 0;
-    }
-    
-    .section-question {
-        font-size: 0.875rem;
-        color: var(--text-secondary);
-        font-style: italic;
-        margin-top: 0.25rem;
-    }
-    
-    /* ===== METRIC CARD STYLES ===== */
-    .metric-card {
-        background: var(--bg-card);
-        border-radius: 12px;
-        padding: 1.25rem;
-        border: 1px solid var(--border-color);
-        transition: all 0.2s ease;
-        height: 100%;
-    }
-    
-    .metric-card:hover {
-        transform: translateY(-2px);
-        border-color: var(--accent-green);
-        box-shadow: var(--shadow-lg);
-    }
-    
-    .metric-label {
-        font-size: 0.75rem;
-        font-weight: 500;
-        color: var(--text-muted);
-        text-transform: uppercase;
-        letter-spacing: 0.05em;
-        margin-bottom: 0.5rem;
-    }
-    
-    .metric-value {
-        font-size: 1.75rem;
-        font-weight: 700;
-        color: var(--text-primary);
-        line-height: 1.2;
-    }
-    
-    .metric-description {
-        font-size: 0.8rem;
-        color: var(--text-secondary);
-        margin-top: 0.5rem;
-    }
-    
-    .metric-benchmark {
-        font-size: 0.75rem;
-        color: var(--text-muted);
-        margin-top: 0.5rem;
-        padding-top: 0.5rem;
-        border-top: 1px solid var(--border-color);
-    }
-    
-    /* ===== STATUS INDICATORS ===== */
-    .status-badge {
-        display: inline-flex;
-        align-items: center;
-        gap: 0.375rem;
-        padding: 0.25rem 0.75rem;
-        border-radius: 9999px;
-        font-size: 0.75rem;
-        font-weight: 600;
-        text-transform: uppercase;
-        letter-spacing: 0.025em;
-    }
-    
-    .status-excellent {
-        background: rgba(5, 150, 105, 0.1);
-        color: var(--status-excellent);
-        border: 1px solid rgba(5, 150, 105, 0.3);
-    }
-    
-    .status-good {
-        background: rgba(2, 132, 199, 0.1);
-        color: var(--status-good);
-        border: 1px solid rgba(2, 132, 199, 0.3);
-    }
-    
-    .status-fair {
-        background: rgba(217, 119, 6, 0.1);
-        color: var(--status-fair);
-        border: 1px solid rgba(217, 119, 6, 0.3);
-    }
-    
-    .status-poor {
-        background: rgba(234, 88, 12, 0.1);
-        color: var(--status-poor);
-        border: 1px solid rgba(234, 88, 12, 0.3);
-    }
-    
-    .status-critical {
-        background: rgba(220, 38, 38, 0.1);
-        color: var(--status-critical);
-        border: 1px solid rgba(220, 38, 38, 0.3);
-    }
-    
-    /* ===== SCORE RING ===== */
-    .score-ring-container {
-        display: flex;
-        flex-direction: column;
-        align-items: center;
-        gap: 0.5rem;
-    }
-    
-    .score-ring {
-        width: 80px;
-        height: 80px;
-        border-radius: 50%;
-        display: flex;
-        align-items: center;
-        justify-content: center;
-        font-size: 1.25rem;
-        font-weight: 700;
-        color: var(--text-primary);
-        position: relative;
-    }
-    
-    .score-label {
-        font-size: 0.75rem;
-        color: var(--text-secondary);
-        text-align: center;
-    }
-    
-    /* ===== PROGRESS BARS ===== */
-    .progress-container {
-        margin-top: 0.75rem;
-    }
-    
-    .progress-bar-bg {
-        height: 6px;
-        background: var(--border-color);
-        border-radius: 3px;
-        overflow: hidden;
-    }
-    
-    .progress-bar-fill {
-        height: 100%;
-        border-radius: 3px;
-        transition: width 0.5s ease;
-    }
-    
-    /* ===== RECOMMENDATION CARDS ===== */
-    .recommendation-item {
-        display: flex;
-        align-items: flex-start;
-        gap: 0.75rem;
-        padding: 0.75rem;
-        background: rgba(5, 150, 105, 0.05);
-        border-radius: 8px;
-        margin-bottom: 0.5rem;
-        border-left: 3px solid var(--accent-green);
-    }
-    
-    .recommendation-icon {
-        color: var(--accent-green);
-        font-size: 1rem;
-        flex-shrink: 0;
-    }
-    
-    .recommendation-text {
-        font-size: 0.875rem;
-        color: var(--text-secondary);
-        line-height: 1.5;
-    }
-    
-    /* ===== NET WORTH SUMMARY ===== */
-    .networth-card {
-        background: linear-gradient(135deg, rgba(5, 150, 105, 0.08) 0%, rgba(217, 119, 6, 0.08) 100%);
-        border: 1px solid rgba(5, 150, 105, 0.2);
-        border-radius: 16px;
-        padding: 1.5rem;
-        text-align: center;
-    }
-    
-    .networth-label {
-        font-size: 0.875rem;
-        color: var(--text-secondary);
-        text-transform: uppercase;
-        letter-spacing: 0.05em;
-    }
-    
-    .networth-value {
-        font-size: 2.5rem;
-        font-weight: 700;
-        color: var(--accent-green);
-        margin: 0.5rem 0;
-    }
-    
-    .networth-breakdown {
-        display: flex;
-        justify-content: center;
-        gap: 2rem;
-        margin-top: 1rem;
-        padding-top: 1rem;
-        border-top: 1px solid var(--border-color);
-    }
-    
-    .breakdown-item {
-        text-align: center;
-    }
-    
-    .breakdown-value {
-        font-size: 1.125rem;
-        font-weight: 600;
-        color: var(--text-primary);
-    }
-    
-    .breakdown-label {
-        font-size: 0.75rem;
-        color: var(--text-muted);
-    }
-    
-    /* ===== SIDEBAR STYLES ===== */
-    .css-1d391kg, [data-testid="stSidebar"] {
-        background: var(--bg-secondary) !important;
-        border-right: 1px solid var(--border-color);
-    }
-    
-    [data-testid="stSidebar"] > div:first-child {
-        background: var(--bg-secondary) !important;
-    }
-    
-    [data-testid="stSidebarContent"] {
-        background: var(--bg-secondary) !important;
-    }
-    
-    [data-testid="stSidebar"] .block-container {
-        padding: 1rem 0;
-    }
-    
-    /* ===== SIDEBAR COLLAPSE BUTTON - ALWAYS VISIBLE ===== */
-    [data-testid="collapsedControl"] {
-        display: flex !important;
-        visibility: visible !important;
-        opacity: 1 !important;
-        position: fixed !important;
-        top: 0.75rem !important;
-        left: 0.75rem !important;
-        z-index: 999999 !important;
-        background: var(--accent-green) !important;
-        border-radius: 8px !important;
-        padding: 0.5rem !important;
-        box-shadow: var(--shadow-lg) !important;
-        border: none !important;
-        transition: all 0.2s ease !important;
-    }
-    
-    [data-testid="collapsedControl"]:hover {
-        background: var(--accent-green-dark) !important;
-        transform: scale(1.05) !important;
-    }
-    
-    [data-testid="collapsedControl"] svg {
-        width: 20px !important;
-        height: 20px !important;
-        color: white !important;
-        fill: white !important;
-    }
-    
-    /* Sidebar expand/collapse button when sidebar is open */
-    [data-testid="stSidebar"] [data-testid="stSidebarCollapseButton"] {
-        background: rgba(5, 150, 105, 0.1) !important;
-        border-radius: 8px !important;
-        border: 1px solid rgba(5, 150, 105, 0.2) !important;
-        transition: all 0.2s ease !important;
-    }
-    
-    [data-testid="stSidebar"] [data-testid="stSidebarCollapseButton"]:hover {
-        background: rgba(5, 150, 105, 0.15) !important;
-        border-color: rgba(5, 150, 105, 0.3) !important;
-    }
-    
-    [data-testid="stSidebar"] [data-testid="stSidebarCollapseButton"] svg {
-        color: var(--accent-green) !important;
-    }
-    
-    /* ===== NAVIGATION SECTION STYLES (Compact line-divided list) ===== */
-    [data-testid="stSidebar"] .stButton {
-        margin: 0 !important;
-        padding: 0 !important;
-    }
-    
-    [data-testid="stSidebar"] button {
-        width: 100% !important;
-        background: transparent !important;
-        border: none !important;
-        border-bottom: 1px solid var(--border-color) !important;
-        border-radius: 0 !important;
-        padding: 0.75rem 1rem !important;
-        margin: 0 !important;
-        text-align: left !important;
-        font-weight: 500 !important;
-        color: var(--text-primary) !important;
-        font-size: 0.875rem !important;
-        transition: all 0.15s ease !important;
-        box-shadow: none !important;
-        min-height: unset !important;
-        height: auto !important;
-        line-height: 1.4 !important;
-    }
-    
-    [data-testid="stSidebar"] button:hover {
-        background: rgba(5, 150, 105, 0.08) !important;
-        color: var(--accent-green) !important;
-    }
-    
-    [data-testid="stSidebar"] button[kind="primary"] {
-        background: rgba(5, 150, 105, 0.1) !important;
-        color: var(--accent-green) !important;
-        font-weight: 600 !important;
-        border-left: 3px solid var(--accent-green) !important;
-    }
-    
-    [data-testid="stSidebar"] button[kind="primary"]:hover {
-        background: rgba(5, 150, 105, 0.15) !important;
-    }
-    
-    [data-testid="stSidebar"] button p {
-        margin: 0 !important;
-        padding: 0 !important;
-        line-height: 1.4 !important;
-    }
-    
-    /* Remove extra spacing between button containers */
-    [data-testid="stSidebar"] [data-testid="stVerticalBlock"] > div {
-        gap: 0 !important;
-    }
-    
-    [data-testid="stSidebar"] .element-container {
-        margin: 0 !important;
-        padding: 0 !important;
-    }
-    
-    /* ===== TABS STYLING ===== */
-    .stTabs [data-baseweb="tab-list"] {
-        gap: 0.5rem;
-        background: var(--bg-secondary);
-        padding: 0.5rem;
-        border-radius: 12px;
-        border: 1px solid var(--border-color);
-    }
-    
-    .stTabs [data-baseweb="tab"] {
-        background: transparent;
-        border-radius: 8px;
-        color: var(--text-secondary);
-        font-weight: 500;
-        padding: 0.5rem 1rem;
-    }
-    
-    .stTabs [aria-selected="true"] {
-        background: var(--accent-green) !important;
-        color: white !important;
-    }
-    
-    /* ===== EXPANDER STYLES ===== */
-    .streamlit-expanderHeader {
-        background: var(--bg-secondary);
-        border-radius: 8px;
-        font-weight: 500;
-        color: var(--text-primary);
-    }
-    
-    /* ===== CHART CONTAINERS ===== */
-    .chart-container {
-        background: var(--bg-card);
-        border-radius: 12px;
-        padding: 1rem;
-        border: 1px solid var(--border-color);
-    }
-    
-    /* ===== GOAL CARDS ===== */
-    .goal-card {
-        background: var(--bg-card);
-        border-radius: 12px;
-        padding: 1.25rem;
-        border: 1px solid var(--border-color);
-        margin-bottom: 1rem;
-    }
-    
-    .goal-header {
-        display: flex;
-        justify-content: space-between;
-        align-items: center;
-        margin-bottom: 1rem;
-    }
-    
-    .goal-name {
-        font-size: 1rem;
-        font-weight: 600;
-        color: var(--text-primary);
-    }
-    
-    .goal-priority {
-        font-size: 0.75rem;
-        padding: 0.25rem 0.5rem;
-        background: var(--accent-gold);
-        color: white;
-        border-radius: 4px;
-        font-weight: 600;
-    }
-    
-    .goal-amounts {
-        display: flex;
-        justify-content: space-between;
-        font-size: 0.875rem;
-        color: var(--text-secondary);
-        margin-top: 0.5rem;
-    }
-    
-    /* ===== CUSTOM SELECTBOX ===== */
-    .stSelectbox > div > div {
-        background: var(--bg-card) !important;
-        border-color: var(--border-color) !important;
-        color: var(--text-primary) !important;
-    }
-    
-    /* Selectbox dropdown menu */
-    [data-baseweb="select"] > div {
-        background-color: var(--bg-card) !important;
-        border-color: var(--border-color) !important;
-    }
-    
-    [data-baseweb="popover"] {
-        background-color: var(--bg-card) !important;
-    }
-    
-    [data-baseweb="popover"] > div {
-        background-color: var(--bg-card) !important;
-    }
-    
-    /* Dropdown menu list */
-    [data-baseweb="menu"] {
-        background-color: var(--bg-card) !important;
-    }
-    
-    [data-baseweb="menu"] li {
-        background-color: var(--bg-card) !important;
-        color: var(--text-primary) !important;
-    }
-    
-    [data-baseweb="menu"] li:hover {
-        background-color: var(--bg-secondary) !important;
-    }
-    
-    /* Selected option in dropdown */
-    [data-baseweb="menu"] [aria-selected="true"] {
-        background-color: rgba(5, 150, 105, 0.1) !important;
-    }
-    
-    /* Selectbox text */
-    [data-baseweb="select"] span {
-        color: var(--text-primary) !important;
-    }
-    
-    /* Selectbox icon */
-    [data-baseweb="select"] svg {
-        fill: var(--text-secondary) !important;
-    }
-    
-    /* ===== TEXT COLORS FOR LIGHT THEME ===== */
-    h1, h2, h3, h4, h5, h6 {
-        color: var(--text-primary) !important;
-    }
-    
-    p, span, div {
-        color: var(--text-primary);
-    }
-    
-    /* ===== ANIMATIONS ===== */
-    @keyframes fadeIn {
-        from { opacity: 0; transform: translateY(10px); }
-        to { opacity: 1; transform: translateY(0); }
-    }
-    
-    .animate-fade-in {
-        animation: fadeIn 0.3s ease-out;
-    }
-    
-    /* ===== RESPONSIVE ADJUSTMENTS ===== */
-    @media (max-width: 768px) {
-        .main .block-container {
-            padding: 1rem;
-        }
-        
-        .dashboard-title {
-            font-size: 1.5rem;
-        }
-        
-        .metric-value {
-            font-size: 1.25rem;
-        }
-        
-        .networth-value {
-            font-size: 1.75rem;
-        }
+import re
+import sys
+from pathlib import Path
+
+import streamlit as st
+
+_STATUS_COLORS = {
+    "excellent": "#059669",
+    "good": "#0284C7",
+    "fair": "#D97706",
+    "poor": "#EA580C",
+    "critical": "#DC2626"
+}
+
+# Status -> CSS class, interned so lookups keyed on these strings stay cheap
+_STATUS_CLASSES = {k: sys.intern(f"status-{k}") for k in _STATUS_COLORS}
+_DEFAULT_STATUS_COLOR = sys.intern("#64748B")
+_DEFAULT_STATUS_CLASS = sys.intern("status-unknown")
+
+
+def _case_insensitive(table: dict) -> dict:
+    """Extend a lowercase-keyed table with UPPER and Title variants."""
+    return {
+        **table,
+        **{k.upper(): v for k, v in table.items()},
+        **{k.title(): v for k, v in table.items()},
     }
-    </style>
+
+
+# Common casings resolve without calling .lower()
+_STATUS_COLORS_CI = _case_insensitive(_STATUS_COLORS)
+_STATUS_CLASSES_CI = _case_insensitive(_STATUS_CLASSES)
+
+
+DEFAULT_THEME = {
+    "bg-primary": "#FAF9F6",
+    "bg-secondary": "#F5F4F0",
+    "bg-card": "#FFFFFF",
+    "bg-card-hover": "#F5F4F0",
+    "text-primary": "#1E293B",
+    "text-secondary": "#475569",
+    "text-muted": "#64748B",
+    "accent-green": "#059669",
+    "accent-green-light": "#10B981",
+    "accent-green-dark": "#047857",
+    "accent-green-a05": "rgba(5, 150, 105, 0.05)",
+    "accent-green-a08": "rgba(5, 150, 105, 0.08)",
+    "accent-green-a10": "rgba(5, 150, 105, 0.1)",
+    "accent-green-a15": "rgba(5, 150, 105, 0.15)",
+    "accent-green-a20": "rgba(5, 150, 105, 0.2)",
+    "accent-green-a30": "rgba(5, 150, 105, 0.3)",
+    "accent-gold": "#D97706",
+    "accent-gold-light": "#F59E0B",
+    "status-excellent": "#059669",
+    "status-good": "#0284C7",
+    "status-fair": "#D97706",
+    "status-poor": "#EA580C",
+    "status-critical": "#DC2626",
+    "border-color": "#E2E8F0",
+    "border-color-dark": "#CBD5E1",
+    "shadow": "0 1px 3px rgba(0, 0, 0, 0.1), 0 1px 2px rgba(0, 0, 0, 0.06)",
+    "shadow-lg": "0 4px 6px -1px rgba(0, 0, 0, 0.1), 0 2px 4px -1px rgba(0, 0, 0, 0.06)",
+}
+
+# Theme name -> CSS custom property values
+THEMES = {"default": DEFAULT_THEME}
+
+
+_RAW_CSS = """
+/* ===== GLOBAL STYLES ===== */
+.stApp {
+    font-family: 'Inter', -apple-system, BlinkMacSystemFont, sans-serif;
+}
+
+/* Force beige background on all main areas (and hide the black header bar) */
+.stApp,
+header[data-testid="stHeader"],
+.stApp > header + div,
+[data-testid="stAppViewContainer"],
+[data-testid="stMain"],
+.main,
+header {
+    background-color: var(--bg-primary) !important;
+}
+
+header[data-testid="stHeader"] {
+    border-bottom: none !important;
+}
+
+/* ===== HIDE STREAMLIT BRANDING ===== */
+#MainMenu {visibility: hidden;}
+footer {visibility: hidden;}
+
+/* ===== MAIN CONTAINER ===== */
+.main .block-container {
+    padding: 2rem 3rem;
+    max-width: 1400px;
+    background-color: var(--bg-primary);
+}
+
+/* ===== HEADER STYLES ===== */
+.dashboard-header {
+    background: #FFFFFF;
+    padding: 2rem 2.5rem;
+    border-radius: 16px;
+    margin-bottom: 2rem;
+    border: 1px solid var(--border-color);
+    box-shadow: var(--shadow-lg);
+}
+
+.dashboard-title {
+    font-size: 2rem;
+    font-weight: 700;
+    color: var(--accent-green);
+    margin: 0;
+    letter-spacing: -0.02em;
+}
+
+.dashboard-subtitle {
+    display: none;
+}
+
+.client-badge {
+    display: inline-flex;
+    align-items: center;
+    gap: 0.5rem;
+    background: var(--accent-green-a10);
+    color: var(--accent-green);
+    padding: 0.5rem 1rem;
+    border-radius: 9999px;
+    font-size: 0.875rem;
+    font-weight: 600;
+    margin-top: 1rem;
+    border: 1px solid var(--accent-green-a20);
+}
+
+/* ===== SECTION STYLES ===== */
+.section-container {
+    background: var(--bg-card);
+    border-radius: 16px;
+    padding: 1.5rem;
+    margin-bottom: 1.5rem;
+    border: 1px solid var(--border-color);
+    box-shadow: var(--shadow);
+    transition: border-color 0.2s ease, box-shadow 0.2s ease;
+    contain: layout style;
+}
+
+.section-container:hover {
+    border-color: var(--accent-green);
+    box-shadow: var(--shadow-lg);
+}
+
+.section-header {
+    display: flex;
+    justify-content: space-between;
+    align-items: center;
+    margin-bottom: 1.5rem;
+    padding-bottom: 1rem;
+    border-bottom: 1px solid var(--border-color);
+}
+
+.section-title {
+    font-size: 1.25rem;
+    font-weight: 600;
+    color: var(--text-primary);
+    margin: 0;
+}
+
+.section-question {
+    font-size: 0.875rem;
+    color: var(--text-secondary);
+    font-style: italic;
+    margin-top: 0.25rem;
+}
+
+/* ===== METRIC CARD STYLES ===== */
+.metric-card {
+    background: var(--bg-card);
+    border-radius: 12px;
+    padding: 1.25rem;
+    border: 1px solid var(--border-color);
+    transition: transform 0.2s ease, border-color 0.2s ease, box-shadow 0.2s ease;
+    height: 100%;
+    contain: layout style;
+    will-change: transform;
+}
+
+.metric-card:hover {
+    transform: translateY(-2px);
+    border-color: var(--accent-green);
+    box-shadow: var(--shadow-lg);
+}
+
+.metric-label {
+    font-size: 0.75rem;
+    font-weight: 500;
+    color: var(--text-muted);
+    text-transform: uppercase;
+    letter-spacing: 0.05em;
+    margin-bottom: 0.5rem;
+}
+
+.metric-value {
+    font-size: 1.75rem;
+    font-weight: 700;
+    color: var(--text-primary);
+    line-height: 1.2;
+}
+
+.metric-description {
+    font-size: 0.8rem;
+    color: var(--text-secondary);
+    margin-top: 0.5rem;
+}
+
+.metric-benchmark {
+    font-size: 0.75rem;
+    color: var(--text-muted);
+    margin-top: 0.5rem;
+    padding-top: 0.5rem;
+    border-top: 1px solid var(--border-color);
+}
+
+/* ===== STATUS INDICATORS ===== */
+.status-badge {
+    display: inline-flex;
+    align-items: center;
+    gap: 0.375rem;
+    padding: 0.25rem 0.75rem;
+    border-radius: 9999px;
+    font-size: 0.75rem;
+    font-weight: 600;
+    text-transform: uppercase;
+    letter-spacing: 0.025em;
+}
+
+.status-excellent {
+    background: var(--accent-green-a10);
+    color: var(--status-excellent);
+    border: 1px solid var(--accent-green-a30);
+}
+
+.status-good {
+    background: rgba(2, 132, 199, 0.1);
+    color: var(--status-good);
+    border: 1px solid rgba(2, 132, 199, 0.3);
+}
+
+.status-fair {
+    background: rgba(217, 119, 6, 0.1);
+    color: var(--status-fair);
+    border: 1px solid rgba(217, 119, 6, 0.3);
+}
+
+.status-poor {
+    background: rgba(234, 88, 12, 0.1);
+    color: var(--status-poor);
+    border: 1px solid rgba(234, 88, 12, 0.3);
+}
+
+.status-critical {
+    background: rgba(220, 38, 38, 0.1);
+    color: var(--status-critical);
+    border: 1px solid rgba(220, 38, 38, 0.3);
+}
+
+/* ===== SCORE RING ===== */
+.section-header-row {
+    display: flex;
+    align-items: flex-start;
+    gap: 1rem;
+}
+
+.section-header-text {
+    flex: 4 1 0;
+    min-width: 0;
+}
+
+.section-header-row > .score-ring-container {
+    flex: 1 1 0;
+}
+
+.score-ring-container {
+    display: flex;
+    flex-direction: column;
+    align-items: center;
+    gap: 0.5rem;
+}
+
+.score-ring {
+    width: 80px;
+    height: 80px;
+    border-radius: 50%;
+    display: flex;
+    align-items: center;
+    justify-content: center;
+    font-size: 1.25rem;
+    font-weight: 700;
+    color: var(--text-primary);
+    position: relative;
+}
+
+.score-label {
+    font-size: 0.75rem;
+    color: var(--text-secondary);
+    text-align: center;
+}
+
+/* ===== PROGRESS BARS ===== */
+.progress-container {
+    margin-top: 0.75rem;
+}
+
+.progress-bar-bg {
+    height: 6px;
+    background: var(--border-color);
+    border-radius: 3px;
+    overflow: hidden;
+}
+
+.progress-bar-fill {
+    height: 100%;
+    border-radius: 3px;
+    transition: width 0.5s ease;
+}
+
+/* ===== METRIC GRID ===== */
+.metric-grid {
+    display: grid;
+    grid-template-columns: repeat(var(--metric-columns, 3), minmax(0, 1fr));
+    gap: 1rem;
+    margin-bottom: 1rem;
+}
+
+.metric-recommendations {
+    margin-top: 0.75rem;
+}
+
+.metric-recommendations > summary {
+    cursor: pointer;
+    font-size: 0.875rem;
+    font-weight: 500;
+    color: var(--text-secondary);
+    margin-bottom: 0.5rem;
+}
+
+/* ===== RECOMMENDATION CARDS ===== */
+.recommendation-item {
+    display: flex;
+    align-items: flex-start;
+    gap: 0.75rem;
+    padding: 0.75rem;
+    background: var(--accent-green-a05);
+    border-radius: 8px;
+    margin-bottom: 0.5rem;
+    border-left: 3px solid var(--accent-green);
+    contain: layout style;
+}
+
+.recommendation-icon {
+    color: var(--accent-green);
+    font-size: 1rem;
+    flex-shrink: 0;
+}
+
+.recommendation-text {
+    font-size: 0.875rem;
+    color: var(--text-secondary);
+    line-height: 1.5;
+}
+
+/* ===== NET WORTH SUMMARY ===== */
+.networth-card {
+    background: linear-gradient(135deg, var(--accent-green-a08) 0%, rgba(217, 119, 6, 0.08) 100%);
+    border: 1px solid var(--accent-green-a20);
+    border-radius: 16px;
+    padding: 1.5rem;
+    text-align: center;
+    contain: layout style;
+}
+
+.networth-label {
+    font-size: 0.875rem;
+    color: var(--text-secondary);
+    text-transform: uppercase;
+    letter-spacing: 0.05em;
+}
+
+.networth-value {
+    font-size: 2.5rem;
+    font-weight: 700;
+    color: var(--accent-green);
+    margin: 0.5rem 0;
+}
+
+.networth-breakdown {
+    display: flex;
+    justify-content: center;
+    gap: 2rem;
+    margin-top: 1rem;
+    padding-top: 1rem;
+    border-top: 1px solid var(--border-color);
+}
+
+.breakdown-item {
+    text-align: center;
+}
+
+.breakdown-value {
+    font-size: 1.125rem;
+    font-weight: 600;
+    color: var(--text-primary);
+}
+
+.breakdown-label {
+    font-size: 0.75rem;
+    color: var(--text-muted);
+}
+
+/* ===== SIDEBAR STYLES ===== */
+.css-1d391kg,
+[data-testid="stSidebar"],
+[data-testid="stSidebar"] > div:first-child,
+[data-testid="stSidebarContent"] {
+    background: var(--bg-secondary) !important;
+}
+
+.css-1d391kg, [data-testid="stSidebar"] {
+    border-right: 1px solid var(--border-color);
+}
+
+[data-testid="stSidebar"] .block-container {
+    padding: 1rem 0;
+}
+
+/* ===== SIDEBAR COLLAPSE BUTTON - ALWAYS VISIBLE ===== */
+[data-testid="collapsedControl"] {
+    display: flex !important;
+    visibility: visible !important;
+    opacity: 1 !important;
+    position: fixed !important;
+    top: 0.75rem !important;
+    left: 0.75rem !important;
+    z-index: 999999 !important;
+    background: var(--accent-green) !important;
+    border-radius: 8px !important;
+    padding: 0.5rem !important;
+    box-shadow: var(--shadow-lg) !important;
+    border: none !important;
+    transition: background 0.2s ease, transform 0.2s ease !important;
+}
+
+[data-testid="collapsedControl"]:hover {
+    background: var(--accent-green-dark) !important;
+    transform: translateZ(0) scale(1.05) !important;
+}
+
+[data-testid="collapsedControl"] svg {
+    width: 20px !important;
+    height: 20px !important;
+    color: white !important;
+    fill: white !important;
+}
+
+/* Sidebar expand/collapse button when sidebar is open */
+[data-testid="stSidebar"] [data-testid="stSidebarCollapseButton"] {
+    background: var(--accent-green-a10) !important;
+    border-radius: 8px !important;
+    border: 1px solid var(--accent-green-a20) !important;
+    transition: background 0.2s ease, border-color 0.2s ease !important;
+}
+
+[data-testid="stSidebar"] [data-testid="stSidebarCollapseButton"]:hover {
+    background: var(--accent-green-a15) !important;
+    border-color: var(--accent-green-a30) !important;
+}
+
+[data-testid="stSidebar"] [data-testid="stSidebarCollapseButton"] svg {
+    color: var(--accent-green) !important;
+}
+
+/* ===== NAVIGATION SECTION STYLES (Compact line-divided list) ===== */
+[data-testid="stSidebar"] .stButton {
+    margin: 0 !important;
+    padding: 0 !important;
+}
+
+[data-testid="stSidebar"] button {
+    width: 100% !important;
+    background: transparent !important;
+    border: none !important;
+    border-bottom: 1px solid var(--border-color) !important;
+    border-radius: 0 !important;
+    padding: 0.75rem 1rem !important;
+    margin: 0 !important;
+    text-align: left !important;
+    font-weight: 500 !important;
+    color: var(--text-primary) !important;
+    font-size: 0.875rem !important;
+    transition: background 0.15s ease, color 0.15s ease !important;
+    box-shadow: none !important;
+    min-height: unset !important;
+    height: auto !important;
+    line-height: 1.4 !important;
+}
+
+[data-testid="stSidebar"] button:hover {
+    background: var(--accent-green-a08) !important;
+    color: var(--accent-green) !important;
+}
+
+[data-testid="stSidebar"] button[kind="primary"] {
+    background: var(--accent-green-a10) !important;
+    color: var(--accent-green) !important;
+    font-weight: 600 !important;
+    border-left: 3px solid var(--accent-green) !important;
+}
+
+[data-testid="stSidebar"] button[kind="primary"]:hover {
+    background: var(--accent-green-a15) !important;
+}
+
+[data-testid="stSidebar"] button p {
+    margin: 0 !important;
+    padding: 0 !important;
+    line-height: 1.4 !important;
+}
+
+/* Remove extra spacing between button containers */
+[data-testid="stSidebar"] [data-testid="stVerticalBlock"] > div {
+    gap: 0 !important;
+}
+
+[data-testid="stSidebar"] .element-container {
+    margin: 0 !important;
+    padding: 0 !important;
+}
+
+/* ===== TABS STYLING ===== */
+.stTabs [data-baseweb="tab-list"] {
+    gap: 0.5rem;
+    background: var(--bg-secondary);
+    padding: 0.5rem;
+    border-radius: 12px;
+    border: 1px solid var(--border-color);
+}
+
+.stTabs [data-baseweb="tab"] {
+    background: transparent;
+    border-radius: 8px;
+    color: var(--text-secondary);
+    font-weight: 500;
+    padding: 0.5rem 1rem;
+}
+
+.stTabs [aria-selected="true"] {
+    background: var(--accent-green) !important;
+    color: white !important;
+}
+
+/* ===== EXPANDER STYLES ===== */
+.streamlit-expanderHeader {
+    background: var(--bg-secondary);
+    border-radius: 8px;
+    font-weight: 500;
+    color: var(--text-primary);
+}
+
+/* ===== CHART CONTAINERS ===== */
+.chart-container {
+    background: var(--bg-card);
+    border-radius: 12px;
+    padding: 1rem;
+    border: 1px solid var(--border-color);
+    contain: layout style;
+}
+
+/* ===== GOAL CARDS ===== */
+.goal-card {
+    background: var(--bg-card);
+    border-radius: 12px;
+    padding: 1.25rem;
+    border: 1px solid var(--border-color);
+    margin-bottom: 1rem;
+    contain: layout style;
+}
+
+.goal-header {
+    display: flex;
+    justify-content: space-between;
+    align-items: center;
+    margin-bottom: 1rem;
+}
+
+.goal-name {
+    font-size: 1rem;
+    font-weight: 600;
+    color: var(--text-primary);
+}
+
+.goal-priority {
+    font-size: 0.75rem;
+    padding: 0.25rem 0.5rem;
+    background: var(--accent-gold);
+    color: white;
+    border-radius: 4px;
+    font-weight: 600;
+}
+
+.goal-amounts {
+    display: flex;
+    justify-content: space-between;
+    font-size: 0.875rem;
+    color: var(--text-secondary);
+    margin-top: 0.5rem;
+}
+
+/* ===== CUSTOM SELECTBOX ===== */
+.stSelectbox > div > div {
+    background: var(--bg-card) !important;
+    border-color: var(--border-color) !important;
+    color: var(--text-primary) !important;
+}
+
+/* Selectbox dropdown menu */
+[data-baseweb="select"] > div {
+    background-color: var(--bg-card) !important;
+    border-color: var(--border-color) !important;
+}
+
+/* Dropdown popover and menu list */
+[data-baseweb="popover"],
+[data-baseweb="popover"] > div,
+[data-baseweb="menu"],
+[data-baseweb="menu"] li {
+    background-color: var(--bg-card) !important;
+}
+
+[data-baseweb="menu"] li {
+    color: var(--text-primary) !important;
+}
+
+[data-baseweb="menu"] li:hover {
+    background-color: var(--bg-secondary) !important;
+}
+
+/* Selected option in dropdown */
+[data-baseweb="menu"] [aria-selected="true"] {
+    background-color: var(--accent-green-a10) !important;
+}
+
+/* Selectbox text */
+[data-baseweb="select"] span {
+    color: var(--text-primary) !important;
+}
+
+/* Selectbox icon */
+[data-baseweb="select"] svg {
+    fill: var(--text-secondary) !important;
+}
+
+/* ===== TEXT COLORS FOR LIGHT THEME ===== */
+h1, h2, h3, h4, h5, h6 {
+    color: var(--text-primary) !important;
+}
+
+p, span, div {
+    color: var(--text-primary);
+}
+
+/* ===== ANIMATIONS ===== */
+@keyframes fadeIn {
+    from { opacity: 0; transform: translateY(10px); }
+    to { opacity: 1; transform: translateY(0); }
+}
+
+.animate-fade-in {
+    animation: fadeIn 0.3s ease-out;
+}
+"""
+
+# Responsive overrides, shipped as a separate media-scoped stylesheet so
+# desktop browsers can skip parsing them
+MOBILE_MEDIA = "(max-width: 768px)"
+_MOBILE_CSS = """
+/* ===== RESPONSIVE ADJUSTMENTS ===== */
+.main .block-container {
+    padding: 1rem;
+}
+
+.dashboard-title {
+    font-size: 1.5rem;
+}
+
+.metric-value {
+    font-size: 1.25rem;
+}
+
+.metric-grid {
+    grid-template-columns: 1fr;
+}
+
+.networth-value {
+    font-size: 1.75rem;
+}
+"""
+
+
+def _minify_css(css: str) -> str:
+    """Strip comments and insignificant whitespace from a stylesheet."""
+    css = re.sub(r"/\*.*?\*/", "", css, flags=re.S)
+    css = re.sub(r"\s+", " ", css)
+    css = re.sub(r"\s*([{}:;,>])\s*", r"\1", css)
+    return css.replace(";}", "}").strip()
+
+
+def _render_theme(theme: dict) -> str:
+    """Build the :root custom property block for a theme."""
+    props = "".join(f"--{name}: {value};" for name, value in theme.items())
+    return f":root {{{props}}}"
+
+
+# Each theme is rendered and minified once at import; this is what ships with
+# every page render
+_MINIFIED_CSS = {
+    name: _minify_css(_render_theme(theme) + _RAW_CSS)
+    for name, theme in THEMES.items()
+}
+_MINIFIED_MOBILE_CSS = _minify_css(_MOBILE_CSS)
+
+# Inter is fetched by its own non-blocking <link> instead of an @import that
+# chains a third-party round trip behind the stylesheet
+FONTS_URL = "https://fonts.googleapis.com/css2?family=Inter:wght@400;500;600;700&display=swap"
+_FONT_LINKS = (
+    '<link rel="preconnect" href="https://fonts.googleapis.com">'
+    '<link rel="preconnect" href="https://fonts.gstatic.com" crossorigin>'
+    f'<link rel="stylesheet" href="{FONTS_URL}">'
+)
+
+# Served by Streamlit static file serving (see .streamlit/config.toml)
+STATIC_DIR = Path(__file__).resolve().parent.parent / "static"
+MOBILE_CSS_FILENAME = "mobile.css"
+
+
+def _css_filename(theme: str) -> str:
+    """Static file name for a theme's stylesheet."""
+    return "dashboard.css" if theme == "default" else f"dashboard-{theme}.css"
+
+
+def _write_css_file(filename: str, css: str) -> bool:
+    """Write a minified stylesheet to the static directory if it is stale."""
+    css_file = STATIC_DIR / filename
+    try:
+        if not css_file.exists() or css_file.stat().st_mtime < Path(__file__).stat().st_mtime:
+            STATIC_DIR.mkdir(exist_ok=True)
+            css_file.write_text(css, encoding="utf-8")
+        return True
+    except OSError:
+        return False
+
+
+def _stylesheet_tag(filename: str, css: str, media: str = "") -> str:
+    """Link to a static stylesheet, falling back to inlining it if it can't be written."""
+    if _write_css_file(filename, css):
+        media_attr = f' media="{media}"' if media else ""
+        return f'<link rel="stylesheet"{media_attr} href="./app/static/{filename}">'
+    if media:
+        css = f"@media {media}{{{css}}}"
+    return f"<style>{css}</style>"
+
+
+_MOBILE_CSS_TAG = _stylesheet_tag(MOBILE_CSS_FILENAME, _MINIFIED_MOBILE_CSS, MOBILE_MEDIA)
+
+_CSS_TAGS = {
+    name: _FONT_LINKS + _stylesheet_tag(_css_filename(name), css) + _MOBILE_CSS_TAG
+    for name, css in _MINIFIED_CSS.items()
+}
+
+
+def get_custom_css(theme: str = "default") -> str:
+    """Return custom CSS for the dashboard."""
+    return _CSS_TAGS[theme]
+
+
+def inject_css(theme: str = "default"):
     """
+    Emit the dashboard stylesheet for the current script run.
+
+    Streamlit drops any element that a rerun does not re-emit, so the tag
+    must be sent on every run; it only references the cached static file.
+    """
+    st.markdown(_CSS_TAGS[theme], unsafe_allow_html=True)
 
 
 def get_status_color(status: str) -> str:
     """Get color for a health status."""
-    colors = {
-        "excellent": "#059669",
-        "good": "#0284C7",
-        "fair": "#D97706",
-        "poor": "#EA580C",
-        "critical": "#DC2626"
-    }
-    return colors.get(status.lower(), "#64748B")
+    return _STATUS_COLORS_CI.get(status) or _STATUS_COLORS_CI.get(status.lower(), _DEFAULT_STATUS_COLOR)
 
 
 def get_status_class(status: str) -> str:
     """Get CSS class for a health status."""
-    return f"status-{status.lower()}"
+    return _STATUS_CLASSES_CI.get(status) or _STATUS_CLASSES_CI.get(status.lower(), _DEFAULT_STATUS_CLASS)
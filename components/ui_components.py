@@ -4,20 +4,91 @@ These components render metrics and data using Streamlit.
 """
 
 import streamlit as st
-from typing import List, Optional, Dict, Any
-import plotly.graph_objects as go
-
-import sys
-import os
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from bisect import bisect_right
+from functools import lru_cache
+from typing import TYPE_CHECKING, List, Optional, Dict, Any
+import numpy as np
 
 from logic.models import MetricResult, HealthStatus, ClientData
 from components.styles import get_status_color, get_status_class
 
+# Plotly is imported inside the figure builders so pages without charts
+# don't pay for it at startup
+if TYPE_CHECKING:
+    import plotly.graph_objects as go
 
-def render_header(client_name: str, client_id: str):
-    """Render the dashboard header."""
-    st.markdown(f"""
+# Resolve status styling once and attach it to the HealthStatus members, so
+# renderers read status._css_class / status._css_color directly
+for _status in HealthStatus:
+    _status._css_class = get_status_class(_status.value)
+    _status._css_color = get_status_color(_status.value)
+del _status
+
+# Gauge bar colour per score band: below 25, 25-45, 45-65, 65-85, 85 and up
+_GAUGE_THRESHOLDS = (25, 45, 65, 85)
+_GAUGE_COLORS = ('#DC2626', '#EA580C', '#D97706', '#0284C7', '#059669')
+
+# Layout pieces shared by every chart. These are set on the figure layout
+# rather than in a plotly template: Streamlit's chart theme writes its own
+# defaults into layout.template, while explicit layout values take precedence
+_CHART_LAYOUT = dict(
+    paper_bgcolor='rgba(255,255,255,0)',
+    plot_bgcolor='rgba(255,255,255,0)'
+)
+_TITLE_FONT = dict(size=16, color='#1E293B')
+
+# Pies show at most this many slices; smaller ones are grouped as 'Other'
+_PIE_MAX_SLICES = 10
+
+# Plotly config: no modebar anywhere; charts whose hover adds nothing over
+# their labels are rendered fully static
+_CHART_CONFIG = {'displayModeBar': False}
+_STATIC_CHART_CONFIG = {'displayModeBar': False, 'staticPlot': True}
+
+# Custom colors for categories - vibrant for light theme
+_ALLOCATION_PALETTE = (
+    '#059669',  # US Stocks - Green
+    '#0284C7',  # International Stocks - Blue
+    '#7C3AED',  # Bonds - Purple
+    '#D97706',  # Real Estate - Gold
+    '#DB2777',  # Commodities - Pink
+    '#64748B',  # Cash - Gray
+    '#0D9488',  # Alternatives - Teal
+    '#EA580C',  # Crypto - Orange
+)
+_BREAKDOWN_PALETTE = (
+    '#059669',  # Green
+    '#0284C7',  # Blue
+    '#7C3AED',  # Purple
+    '#D97706',  # Gold
+    '#DB2777',  # Pink
+    '#0D9488',  # Teal
+    '#EA580C',  # Orange
+    '#4F46E5',  # Indigo
+    '#65A30D',  # Lime
+    '#DC2626',  # Red
+)
+_AXIS_STYLE = dict(
+    title_font=dict(color='#475569'),
+    tickfont=dict(color='#475569'),
+    gridcolor='#E2E8F0'
+)
+
+# Hover and slice text templates. Pie text is given as a texttemplate
+# equivalent to textinfo='label+percent' (parts joined by <br>)
+_PIE_TEXT = '%{label}<br>%{percent}'
+_ALLOCATION_HOVER = '<b>%{label}</b><br>%{value:.1f}%<extra></extra>'
+_BREAKDOWN_HOVER = '<b>%{label}</b><br>$%{value:,.0f}<br>%{percent}<extra></extra>'
+_EXPENSE_HOVER = '<b>%{y}</b><br>$%{x:,.0f}<br>%{customdata:.1f}% of income<extra></extra>'
+
+
+@lru_cache(maxsize=4096)
+def _fmt_usd(amount: int) -> str:
+    """Format a whole-dollar amount as a currency label."""
+    return f"${amount:,}"
+
+
+_HEADER_TMPL = """
     <div class="dashboard-header">
         <h1 class="dashboard-title">Financial Health Dashboard</h1>
         <p class="dashboard-subtitle">Comprehensive financial wellness analysis and insights</p>
@@ -26,70 +97,127 @@ def render_header(client_name: str, client_id: str):
             <span style="opacity: 0.7">({client_id})</span>
         </div>
     </div>
-    """, unsafe_allow_html=True)
+    """
 
 
-def render_net_worth_summary(client_data: ClientData):
-    """Render the net worth summary card."""
-    net_worth = client_data.net_worth
-    liquid_nw = client_data.liquid_net_worth
-    total_assets = client_data.assets.total_assets
-    total_liabilities = client_data.liabilities.total_liabilities
-    
-    st.markdown(f"""
+@lru_cache(maxsize=256)
+def _header_html(client_name: str, client_id: str) -> str:
+    """Build the dashboard header HTML for a client."""
+    return _HEADER_TMPL.format_map({'client_name': client_name, 'client_id': client_id})
+
+
+def render_header(client_name: str, client_id: str):
+    """Render the dashboard header."""
+    st.markdown(_header_html(client_name, client_id), unsafe_allow_html=True)
+
+
+_NET_WORTH_TMPL = """
     <div class="networth-card animate-fade-in">
         <div class="networth-label">Total Net Worth</div>
-        <div class="networth-value">${net_worth:,.0f}</div>
+        <div class="networth-value">{net_worth}</div>
         <div class="networth-breakdown">
             <div class="breakdown-item">
-                <div class="breakdown-value" style="color: #059669;">${total_assets:,.0f}</div>
+                <div class="breakdown-value" style="color: #059669;">{total_assets}</div>
                 <div class="breakdown-label">Total Assets</div>
             </div>
             <div class="breakdown-item">
-                <div class="breakdown-value" style="color: #DC2626;">${total_liabilities:,.0f}</div>
+                <div class="breakdown-value" style="color: #DC2626;">{total_liabilities}</div>
                 <div class="breakdown-label">Total Liabilities</div>
             </div>
             <div class="breakdown-item">
-                <div class="breakdown-value" style="color: #0284C7;">${liquid_nw:,.0f}</div>
+                <div class="breakdown-value" style="color: #0284C7;">{liquid_nw}</div>
                 <div class="breakdown-label">Liquid Net Worth</div>
             </div>
         </div>
     </div>
-    """, unsafe_allow_html=True)
+    """
 
 
-def render_section_header(title: str, question: str, score: float, status: HealthStatus):
-    """Render a section header with score."""
-    status_class = get_status_class(status.value)
-    status_color = get_status_color(status.value)
-    
-    col1, col2 = st.columns([4, 1])
-    
-    with col1:
-        st.markdown(f"""
-        <div style="margin-bottom: 0.5rem;">
+def render_net_worth_summary(client_data: ClientData):
+    """Render the net worth summary card."""
+    st.markdown(_NET_WORTH_TMPL.format_map({
+        'net_worth': _fmt_usd(round(client_data.net_worth)),
+        'liquid_nw': _fmt_usd(round(client_data.liquid_net_worth)),
+        'total_assets': _fmt_usd(round(client_data.assets.total_assets)),
+        'total_liabilities': _fmt_usd(round(client_data.liabilities.total_liabilities)),
+    }), unsafe_allow_html=True)
+
+
+_SECTION_HEADER_TMPL = """
+    <div class="section-header-row">
+        <div class="section-header-text" style="margin-bottom: 0.5rem;">
             <h2 style="font-size: 1.25rem; font-weight: 600; color: #1E293B; margin: 0;">{title}</h2>
             <p style="font-size: 0.875rem; color: #475569; font-style: italic; margin-top: 0.25rem;">"{question}"</p>
         </div>
-        """, unsafe_allow_html=True)
-    
-    with col2:
-        st.markdown(f"""
         <div class="score-ring-container">
-            <div class="score-ring" style="background: conic-gradient({status_color} {score * 3.6}deg, #E2E8F0 0deg);">
+            <div class="score-ring" style="background: conic-gradient({status_color} {angle}deg, #E2E8F0 0deg);">
                 <div style="background: #FFFFFF; width: 60px; height: 60px; border-radius: 50%; display: flex; align-items: center; justify-content: center; color: #1E293B; border: 1px solid #E2E8F0;">
                     {score:.0f}
                 </div>
             </div>
             <span class="score-label">Section Score</span>
         </div>
-        """, unsafe_allow_html=True)
+    </div>
+    """
 
 
-def render_metric_card(label: str, metric: MetricResult, show_recommendations: bool = False):
-    """Render a single metric card."""
-    status_class = get_status_class(metric.status.value)
-    status_color = get_status_color(metric.status.value)
+def render_section_header(title: str, question: str, score: float, status: HealthStatus):
+    """Render a section header with score as a single flex row."""
+    st.markdown(_SECTION_HEADER_TMPL.format_map({
+        'title': title,
+        'question': question,
+        'status_color': status._css_color,
+        'angle': score * 3.6,
+        'score': score,
+    }), unsafe_allow_html=True)
+
+
+def _recommendations_html(metric: MetricResult) -> str:
+    """Build the recommendation items for a metric as one HTML string."""
+    return "".join(
+        f'<div class="recommendation-item">'
+        f'<span class="recommendation-icon">→</span>'
+        f'<span class="recommendation-text">{rec}</span>'
+        f'</div>'
+        for rec in metric.recommendations
+    )
+
+
+# Delta formatters keyed by MetricResult.delta_format, and arrow/colour by
+# whether the change is good
+_DELTA_FORMATS = {
+    'pct': "{:.1f}%".format,
+    'usd': "${:,.0f}".format,
+    'num': "{:.1f}".format,
+}
+_DELTA_ARROWS = {True: ("↑", "#059669"), False: ("↓", "#DC2626")}
+
+# Card markup is kept free of blank lines, which would end the markdown HTML
+# block; the optional fragments are appended inline
+_METRIC_CARD_TMPL = """
+    <div class="metric-card animate-fade-in">
+        <div style="display: flex; justify-content: space-between; align-items: flex-start;">
+            <div class="metric-label">{label}</div>
+            <span class="status-badge {status_class}">{status}</span>
+        </div>
+        <div class="metric-value" style="display: flex; align-items: baseline;">{display_value}{delta_html}</div>{description_html}
+        <div class="progress-container">
+            <div class="progress-bar-bg">
+                <div class="progress-bar-fill" style="width: {progress}%; background: {status_color};"></div>
+            </div>
+        </div>{benchmark_html}{recs_html}
+    </div>"""
+
+
+def metric_card_html(label: str, metric: MetricResult, show_recommendations: bool = False) -> str:
+    """
+    Build the HTML for a single metric card.
+    
+    Recommendations, when requested, are embedded as a native <details>
+    disclosure so the whole card can be emitted as one markdown element.
+    """
+    status_class = metric.status._css_class
+    status_color = metric.status._css_color
     
     # Progress calculation for visual indicator
     if metric.benchmark and metric.benchmark > 0:
@@ -103,236 +231,317 @@ def render_metric_card(label: str, metric: MetricResult, show_recommendations: b
     # Build delta HTML if available
     delta_html = ""
     if metric.delta is not None and metric.delta_is_positive is not None:
-        arrow = "↑" if metric.delta_is_positive else "↓"
-        arrow_color = "#059669" if metric.delta_is_positive else "#DC2626"
+        arrow, arrow_color = _DELTA_ARROWS[bool(metric.delta_is_positive)]
         # Format delta based on the metric type (percentage vs absolute)
-        if '%' in metric.display_value:
-            delta_display = f"{metric.delta:.1f}%"
-        elif '$' in metric.display_value:
-            delta_display = f"${metric.delta:,.0f}"
-        else:
-            delta_display = f"{metric.delta:.1f}"
+        delta_display = _DELTA_FORMATS[metric.delta_format](metric.delta)
         delta_html = f'<span style="font-size: 0.875rem; color: {arrow_color}; margin-left: 0.5rem; font-weight: 500;">{arrow} {delta_display}</span>'
     
-    html = f"""
-    <div class="metric-card animate-fade-in">
-        <div style="display: flex; justify-content: space-between; align-items: flex-start;">
-            <div class="metric-label">{label}</div>
-            <span class="status-badge {status_class}">{metric.status.value}</span>
-        </div>
-        <div class="metric-value" style="display: flex; align-items: baseline;">{metric.display_value}{delta_html}</div>
-        {f'<div class="metric-description">{metric.description}</div>' if metric.description else ''}
-        <div class="progress-container">
-            <div class="progress-bar-bg">
-                <div class="progress-bar-fill" style="width: {progress}%; background: {status_color};"></div>
-            </div>
-        </div>
-        {f'<div class="metric-benchmark">{metric.benchmark_label}</div>' if metric.benchmark_label else ''}
-    </div>
-    """
-    st.markdown(html, unsafe_allow_html=True)
-    
+    description_html = f'<div class="metric-description">{metric.description}</div>' if metric.description else ''
+    benchmark_html = f'<div class="metric-benchmark">{metric.benchmark_label}</div>' if metric.benchmark_label else ''
+    recs_html = ''
     if show_recommendations and metric.recommendations:
-        with st.expander("💡 Recommendations", expanded=False):
-            for rec in metric.recommendations:
-                st.markdown(f"""
-                <div class="recommendation-item">
-                    <span class="recommendation-icon">→</span>
-                    <span class="recommendation-text">{rec}</span>
-                </div>
-                """, unsafe_allow_html=True)
+        recs_html = (
+            f'<details class="metric-recommendations">'
+            f'<summary>💡 Recommendations</summary>{_recommendations_html(metric)}'
+            f'</details>'
+        )
+    
+    return _METRIC_CARD_TMPL.format_map({
+        'label': label,
+        'status_class': status_class,
+        'status': metric.status.value,
+        'display_value': metric.display_value,
+        'delta_html': delta_html,
+        'description_html': description_html,
+        'progress': progress,
+        'status_color': status_color,
+        'benchmark_html': benchmark_html,
+        'recs_html': recs_html,
+    })
+
+
+def render_metric_card(label: str, metric: MetricResult, show_recommendations: bool = False):
+    """Render a single metric card."""
+    st.markdown(metric_card_html(label, metric, show_recommendations), unsafe_allow_html=True)
 
 
 def render_metric_grid(metrics: Dict[str, MetricResult], columns: int = 3):
-    """Render metrics in a grid layout."""
-    metric_items = list(metrics.items())
+    """
+    Render metrics in a grid layout.
     
-    for i in range(0, len(metric_items), columns):
-        cols = st.columns(columns)
-        for j, col in enumerate(cols):
-            if i + j < len(metric_items):
-                key, metric = metric_items[i + j]
-                with col:
-                    # Convert key to readable label
-                    label = key.replace("_", " ").title()
-                    render_metric_card(label, metric, show_recommendations=True)
+    All cards go out as a single CSS-grid markdown element rather than one
+    st.columns row per line of cards.
+    """
+    # Convert keys to readable labels
+    cards = "".join(
+        metric_card_html(key.replace("_", " ").title(), metric, show_recommendations=True)
+        for key, metric in metrics.items()
+    )
+    st.markdown(
+        f'<div class="metric-grid" style="--metric-columns: {columns};">{cards}\n</div>',
+        unsafe_allow_html=True
+    )
 
 
-def render_allocation_chart(allocation: Dict[str, float], title: str = "Portfolio Allocation"):
-    """Render a portfolio allocation donut chart."""
-    labels = list(allocation.keys())
-    values = list(allocation.values())
-    
-    # Custom colors for categories - vibrant for light theme
-    colors = [
-        '#059669',  # US Stocks - Green
-        '#0284C7',  # International Stocks - Blue
-        '#7C3AED',  # Bonds - Purple
-        '#D97706',  # Real Estate - Gold
-        '#DB2777',  # Commodities - Pink
-        '#64748B',  # Cash - Gray
-        '#0D9488',  # Alternatives - Teal
-        '#EA580C',  # Crypto - Orange
-    ]
-    
-    fig = go.Figure(data=[go.Pie(
-        labels=labels,
-        values=values,
-        hole=0.6,
-        marker_colors=colors[:len(labels)],
-        textinfo='label+percent',
-        textposition='outside',
-        textfont=dict(size=12, color='#1E293B'),
-        hovertemplate='<b>%{label}</b><br>%{value:.1f}%<extra></extra>'
-    )])
-    
-    fig.update_layout(
-        title=dict(
-            text=title,
-            font=dict(size=16, color='#1E293B'),
-            x=0.5
-        ),
-        showlegend=False,
-        paper_bgcolor='rgba(255,255,255,0)',
-        plot_bgcolor='rgba(255,255,255,0)',
-        margin=dict(t=50, b=20, l=20, r=20),
-        height=350,
-        annotations=[dict(
-            text='Allocation',
-            x=0.5, y=0.5,
-            font=dict(size=14, color='#475569'),
-            showarrow=False
-        )]
+def _cap_slices(labels, values: np.ndarray, limit: int = _PIE_MAX_SLICES):
+    """Keep the largest ``limit - 1`` pie slices and fold the rest into 'Other'."""
+    if values.size <= limit:
+        return labels, values
+    order = np.argsort(-values, kind='stable')
+    head, tail = order[:limit - 1], order[limit - 1:]
+    return (
+        np.append(np.asarray(labels)[head], 'Other'),
+        np.append(values[head], values[tail].sum())
     )
-    
-    st.plotly_chart(fig, use_container_width=True)
 
 
-def render_goal_progress(goals: List[Dict], title: str = ""):
-    """Render goal progress cards."""
-    if title:
-        st.markdown(f"""
-        <div style="margin-bottom: 0.75rem;">
-            <h3 style="font-size: 1rem; font-weight: 600; color: #1E293B; margin: 0;">{title}</h3>
-        </div>
-        """, unsafe_allow_html=True)
+@st.cache_resource(max_entries=64, show_spinner=False)
+def _build_allocation_figure(items: tuple, title: str) -> 'go.Figure':
+    """Build the allocation donut for ``(label, value)`` pairs."""
+    import plotly.graph_objects as go
+    
+    labels, values = zip(*items) if items else ((), ())
+    labels, values = _cap_slices(labels, np.asarray(values, dtype=np.float64))
+    
+    fig = go.Figure(
+        data=[go.Pie(
+            labels=labels,
+            values=values,
+            hole=0.6,
+            marker_colors=_ALLOCATION_PALETTE[:len(labels)],
+            texttemplate=_PIE_TEXT,
+            textposition='outside',
+            textfont=dict(size=12, color='#1E293B'),
+            hovertemplate=_ALLOCATION_HOVER
+        )],
+        layout=dict(
+            **_CHART_LAYOUT,
+            title=dict(
+                text=title,
+                font=_TITLE_FONT,
+                x=0.5
+            ),
+            showlegend=False,
+            margin=dict(t=50, b=20, l=20, r=20),
+            height=350,
+            annotations=[dict(
+                text='Allocation',
+                x=0.5, y=0.5,
+                font=dict(size=14, color='#475569'),
+                showarrow=False
+            )]
+        )
+    )
     
-    for goal in goals:
-        progress = (goal['current'] / goal['target']) * 100 if goal['target'] > 0 else 0
-        status_color = get_status_color(goal.get('status', 'fair'))
-        
-        st.markdown(f"""
+    return fig
+
+
+def render_allocation_chart(
+    allocation: Dict[str, float],
+    title: str = "Portfolio Allocation",
+    key: Optional[str] = None
+):
+    """Render a portfolio allocation donut chart."""
+    fig = _build_allocation_figure(tuple(allocation.items()), title)
+    st.plotly_chart(
+        fig,
+        use_container_width=True,
+        key=key or f"chart_allocation_{title}",
+        config=_STATIC_CHART_CONFIG
+    )
+
+
+_GOAL_CARD_TMPL = """
         <div class="goal-card">
             <div class="goal-header">
-                <span class="goal-name">{goal['name']}</span>
-                <span class="goal-priority">Priority {goal.get('priority', '-')}</span>
+                <span class="goal-name">{name}</span>
+                <span class="goal-priority">Priority {priority}</span>
             </div>
             <div class="progress-container">
                 <div class="progress-bar-bg" style="height: 8px;">
-                    <div class="progress-bar-fill" style="width: {min(100, progress)}%; background: {status_color};"></div>
+                    <div class="progress-bar-fill" style="width: {width}%; background: {status_color};"></div>
                 </div>
             </div>
             <div class="goal-amounts">
-                <span>${goal['current']:,.0f} saved</span>
-                <span>{progress:.0f}% of ${goal['target']:,.0f}</span>
+                <span>{current} saved</span>
+                <span>{progress:.0f}% of {target}</span>
             </div>
         </div>
-        """, unsafe_allow_html=True)
+        """
 
 
-def render_expense_breakdown(expenses: Dict[str, float], income: float):
-    """Render expense breakdown chart."""
-    # Sort by value descending
-    sorted_expenses = dict(sorted(expenses.items(), key=lambda x: x[1], reverse=True))
+def render_goal_progress(goals: List[Dict], title: str = ""):
+    """Render goal progress cards."""
+    parts = []
+    if title:
+        parts.append(f"""
+        <div style="margin-bottom: 0.75rem;">
+            <h3 style="font-size: 1rem; font-weight: 600; color: #1E293B; margin: 0;">{title}</h3>
+        </div>
+        """)
+    
+    currents = np.fromiter((goal['current'] for goal in goals), dtype=np.float64, count=len(goals))
+    targets = np.fromiter((goal['target'] for goal in goals), dtype=np.float64, count=len(goals))
+    has_target = targets > 0
+    progress = np.divide(currents, targets, out=np.zeros_like(currents), where=has_target) * 100
+    widths = np.minimum(progress, 100)
+    
+    for goal, pct, width in zip(goals, progress.tolist(), widths.tolist()):
+        status_color = get_status_color(goal.get('status', 'fair'))
+        
+        parts.append(_GOAL_CARD_TMPL.format_map({
+            'name': goal['name'],
+            'priority': goal.get('priority', '-'),
+            'width': width,
+            'status_color': status_color,
+            'current': _fmt_usd(round(goal['current'])),
+            'target': _fmt_usd(round(goal['target'])),
+            'progress': pct,
+        }))
+    
+    if parts:
+        st.markdown("".join(parts), unsafe_allow_html=True)
+
+
+@st.cache_resource(max_entries=64, show_spinner=False)
+def _build_expense_figure(items: tuple, income: float) -> 'go.Figure':
+    """Build the expense bar chart for ``(category, amount)`` pairs."""
+    import plotly.graph_objects as go
     
-    fig = go.Figure()
+    categories, amounts = zip(*items) if items else ((), ())
+    categories, amounts = np.array(categories), np.asarray(amounts, dtype=np.float64)
+    
+    # Sort by value descending (stable, so ties keep their input order)
+    order = np.argsort(-amounts, kind='stable')
+    categories, amounts = categories[order], amounts[order]
     
     # Create horizontal bar chart
-    fig.add_trace(go.Bar(
-        y=list(sorted_expenses.keys()),
-        x=list(sorted_expenses.values()),
-        orientation='h',
-        marker_color='#059669',
-        text=[f'${v:,.0f}' for v in sorted_expenses.values()],
-        textposition='outside',
-        textfont=dict(color='#1E293B', size=11),
-        hovertemplate='<b>%{y}</b><br>$%{x:,.0f}<br>%{customdata:.1f}% of income<extra></extra>',
-        customdata=[v/income*100 for v in sorted_expenses.values()]
-    ))
-    
-    fig.update_layout(
-        title=dict(
-            text='Monthly Expense Breakdown',
-            font=dict(size=16, color='#1E293B'),
-            x=0
-        ),
-        xaxis=dict(
-            title='Amount ($)',
-            title_font=dict(color='#475569'),
-            tickfont=dict(color='#475569'),
-            gridcolor='#E2E8F0',
-            showgrid=True
-        ),
-        yaxis=dict(
-            tickfont=dict(color='#1E293B', size=11),
-            autorange='reversed'
-        ),
-        paper_bgcolor='rgba(255,255,255,0)',
-        plot_bgcolor='rgba(255,255,255,0)',
-        margin=dict(t=50, b=40, l=120, r=80),
-        height=400
+    fig = go.Figure(
+        data=[go.Bar(
+            y=categories,
+            x=amounts,
+            orientation='h',
+            marker_color='#059669',
+            text=[_fmt_usd(round(v)) for v in amounts],
+            textposition='outside',
+            textfont=dict(color='#1E293B', size=11),
+            cliponaxis=False,
+            hovertemplate=_EXPENSE_HOVER,
+            customdata=amounts / income * 100
+        )],
+        layout=dict(
+            **_CHART_LAYOUT,
+            title=dict(
+                text='Monthly Expense Breakdown',
+                font=_TITLE_FONT,
+                x=0
+            ),
+            xaxis=dict(
+                title='Amount ($)',
+                showgrid=True,
+                **_AXIS_STYLE
+            ),
+            yaxis=dict(
+                tickfont=dict(color='#1E293B', size=11),
+                autorange='reversed'
+            ),
+            margin=dict(t=50, b=40, l=120, r=80),
+            height=400
+        )
     )
     
-    st.plotly_chart(fig, use_container_width=True)
+    return fig
 
 
-def render_retirement_projection_chart(
+def render_expense_breakdown(expenses: Dict[str, float], income: float, key: Optional[str] = None):
+    """Render expense breakdown chart."""
+    fig = _build_expense_figure(tuple(expenses.items()), income)
+    st.plotly_chart(
+        fig,
+        use_container_width=True,
+        key=key or "chart_expenses",
+        config=_CHART_CONFIG
+    )
+
+
+@st.cache_resource(max_entries=64, show_spinner=False)
+def _build_retirement_figure(
     current_age: int,
     retirement_age: int,
     current_savings: float,
     projected_savings: float,
     target_amount: float
-):
-    """Render retirement projection chart."""
-    years = list(range(current_age, retirement_age + 10))
+) -> 'go.Figure':
+    """Build the retirement projection chart."""
+    import plotly.graph_objects as go
+    
+    years = np.arange(current_age, retirement_age + 10)
     years_to_retirement = retirement_age - current_age
     
     # Simplified growth calculation
     growth_rate = 0.06  # Real return after inflation
-    projected_values = []
-    
-    for i, year in enumerate(years):
-        if i <= years_to_retirement:
-            # Accumulation phase
-            growth_factor = (1 + growth_rate) ** i
-            projected_values.append(current_savings * growth_factor + 
-                                   (projected_savings - current_savings) * (i / years_to_retirement) if years_to_retirement > 0 else current_savings)
-        else:
-            # Withdrawal phase (simplified)
-            years_in_retirement = i - years_to_retirement
-            projected_values.append(projected_savings * (1 - 0.04 * years_in_retirement))
-    
-    fig = go.Figure()
-    
-    # Projected savings line
-    fig.add_trace(go.Scatter(
-        x=years,
-        y=projected_values,
-        mode='lines',
-        name='Projected Savings',
-        line=dict(color='#059669', width=3),
-        fill='tozeroy',
-        fillcolor='rgba(5, 150, 105, 0.1)'
-    ))
-    
-    # Target line
-    fig.add_trace(go.Scatter(
-        x=[years[0], years[-1]],
-        y=[target_amount, target_amount],
-        mode='lines',
-        name='Target',
-        line=dict(color='#D97706', width=2, dash='dash')
-    ))
+    idx = np.arange(years.size, dtype=float)
+    n_acc = min(max(years_to_retirement + 1, 0), years.size)
+    
+    # Accumulation phase
+    acc_idx = idx[:n_acc]
+    if years_to_retirement > 0:
+        accumulation = (current_savings * (1 + growth_rate) ** acc_idx +
+                        (projected_savings - current_savings) * (acc_idx / years_to_retirement))
+    else:
+        accumulation = np.full(acc_idx.size, float(current_savings))
+    
+    # Withdrawal phase (simplified)
+    years_in_retirement = idx[n_acc:] - years_to_retirement
+    withdrawal = projected_savings * (1 - 0.04 * years_in_retirement)
+    
+    projected_values = np.concatenate([accumulation, withdrawal])
+    
+    fig = go.Figure(
+        data=[
+            # Projected savings line
+            go.Scattergl(
+                x=years,
+                y=projected_values,
+                mode='lines',
+                name='Projected Savings',
+                line=dict(color='#059669', width=3),
+                fill='tozeroy',
+                fillcolor='rgba(5, 150, 105, 0.1)'
+            ),
+            # Target line
+            go.Scattergl(
+                x=[years[0], years[-1]],
+                y=[target_amount, target_amount],
+                mode='lines',
+                name='Target',
+                line=dict(color='#D97706', width=2, dash='dash')
+            )
+        ],
+        layout=dict(
+            **_CHART_LAYOUT,
+            title=dict(
+                text='Retirement Projection',
+                font=_TITLE_FONT,
+                x=0
+            ),
+            xaxis=dict(
+                title='Age',
+                **_AXIS_STYLE
+            ),
+            yaxis=dict(
+                title='Portfolio Value ($)',
+                tickformat='$,.0f',
+                **_AXIS_STYLE
+            ),
+            legend=dict(
+                font=dict(color='#1E293B'),
+                bgcolor='rgba(255,255,255,0)'
+            ),
+            margin=dict(t=50, b=40, l=80, r=40),
+            height=350
+        )
+    )
     
     # Retirement marker
     fig.add_vline(
@@ -342,149 +551,169 @@ def render_retirement_projection_chart(
         annotation_position='top'
     )
     
-    fig.update_layout(
-        title=dict(
-            text='Retirement Projection',
-            font=dict(size=16, color='#1E293B'),
-            x=0
-        ),
-        xaxis=dict(
-            title='Age',
-            title_font=dict(color='#475569'),
-            tickfont=dict(color='#475569'),
-            gridcolor='#E2E8F0'
-        ),
-        yaxis=dict(
-            title='Portfolio Value ($)',
-            title_font=dict(color='#475569'),
-            tickfont=dict(color='#475569'),
-            gridcolor='#E2E8F0',
-            tickformat='$,.0f'
-        ),
-        paper_bgcolor='rgba(255,255,255,0)',
-        plot_bgcolor='rgba(255,255,255,0)',
-        legend=dict(
-            font=dict(color='#1E293B'),
-            bgcolor='rgba(255,255,255,0)'
-        ),
-        margin=dict(t=50, b=40, l=80, r=40),
-        height=350
+    return fig
+
+
+def render_retirement_projection_chart(
+    current_age: int,
+    retirement_age: int,
+    current_savings: float,
+    projected_savings: float,
+    target_amount: float,
+    key: Optional[str] = None
+):
+    """Render retirement projection chart."""
+    fig = _build_retirement_figure(
+        current_age, retirement_age, current_savings, projected_savings, target_amount
+    )
+    st.plotly_chart(
+        fig,
+        use_container_width=True,
+        key=key or "chart_retirement",
+        config=_CHART_CONFIG
     )
-    
-    st.plotly_chart(fig, use_container_width=True)
 
 
-def render_asset_breakdown_chart(assets: Dict[str, float], title: str = "Asset Breakdown"):
-    """Render asset/liability breakdown as a pie chart."""
-    # Prepare data
-    categories = list(assets.keys())
-    values = list(assets.values())
+@st.cache_resource(max_entries=64, show_spinner=False)
+def _build_asset_breakdown_figure(items: tuple, title: str) -> Optional['go.Figure']:
+    """
+    Build the asset breakdown pie for ``(category, value)`` pairs.
+    
+    Returns None when no category has a positive value.
+    """
+    import plotly.graph_objects as go
+    
+    categories, values = zip(*items) if items else ((), ())
+    categories, values = np.array(categories), np.asarray(values, dtype=np.float64)
     
     # Filter out zero values
-    data = [(c, v) for c, v in zip(categories, values) if v > 0]
-    if not data:
+    mask = values > 0
+    if not mask.any():
+        return None
+    categories, values = _cap_slices(categories[mask], values[mask])
+    
+    # Calculate total for percentage display
+    total = values.sum()
+    
+    fig = go.Figure(
+        data=[go.Pie(
+            labels=categories,
+            values=values,
+            hole=0.5,
+            marker_colors=_BREAKDOWN_PALETTE[:len(categories)],
+            texttemplate=_PIE_TEXT,
+            textposition='outside',
+            textfont=dict(size=11, color='#1E293B'),
+            hovertemplate=_BREAKDOWN_HOVER
+        )],
+        layout=dict(
+            **_CHART_LAYOUT,
+            title=dict(
+                text=title,
+                font=_TITLE_FONT,
+                x=0.5
+            ),
+            showlegend=False,
+            margin=dict(t=50, b=20, l=20, r=20),
+            height=400,
+            annotations=[dict(
+                text=_fmt_usd(round(total)),
+                x=0.5, y=0.5,
+                font=dict(size=16, color='#1E293B', weight=600),
+                showarrow=False
+            )]
+        )
+    )
+    
+    return fig
+
+
+def render_asset_breakdown_chart(
+    assets: Dict[str, float],
+    title: str = "Asset Breakdown",
+    key: Optional[str] = None
+):
+    """Render asset/liability breakdown as a pie chart."""
+    fig = _build_asset_breakdown_figure(tuple(assets.items()), title)
+    if fig is None:
         st.info("No data to display")
         return
     
-    categories, values = zip(*data)
-    
-    # Custom colors for categories - vibrant for light theme
-    colors = [
-        '#059669',  # Green
-        '#0284C7',  # Blue
-        '#7C3AED',  # Purple
-        '#D97706',  # Gold
-        '#DB2777',  # Pink
-        '#0D9488',  # Teal
-        '#EA580C',  # Orange
-        '#4F46E5',  # Indigo
-        '#65A30D',  # Lime
-        '#DC2626',  # Red
-    ]
-    
-    # Calculate total for percentage display
-    total = sum(values)
-    
-    fig = go.Figure(data=[go.Pie(
-        labels=categories,
-        values=values,
-        hole=0.5,
-        marker_colors=colors[:len(categories)],
-        textinfo='label+percent',
-        textposition='outside',
-        textfont=dict(size=11, color='#1E293B'),
-        hovertemplate='<b>%{label}</b><br>$%{value:,.0f}<br>%{percent}<extra></extra>'
-    )])
-    
-    fig.update_layout(
-        title=dict(
-            text=title,
-            font=dict(size=16, color='#1E293B'),
-            x=0.5
-        ),
-        showlegend=False,
-        paper_bgcolor='rgba(255,255,255,0)',
-        plot_bgcolor='rgba(255,255,255,0)',
-        margin=dict(t=50, b=20, l=20, r=20),
-        height=400,
-        annotations=[dict(
-            text=f'${total:,.0f}',
-            x=0.5, y=0.5,
-            font=dict(size=16, color='#1E293B', weight=600),
-            showarrow=False
-        )]
+    st.plotly_chart(
+        fig,
+        use_container_width=True,
+        key=key or f"chart_breakdown_{title}",
+        config=_CHART_CONFIG
+    )
+
+
+@st.cache_resource(max_entries=64, show_spinner=False)
+def _build_health_gauge_figure(score: float, label: str) -> 'go.Figure':
+    """Build the overall health score gauge."""
+    import plotly.graph_objects as go
+    
+    color = _GAUGE_COLORS[bisect_right(_GAUGE_THRESHOLDS, score)]
+    
+    fig = go.Figure(
+        data=[go.Indicator(
+            mode="gauge+number",
+            value=score,
+            domain={'x': [0, 1], 'y': [0, 1]},
+            title={'text': label, 'font': {'size': 16, 'color': '#1E293B'}},
+            number={'font': {'size': 40, 'color': '#1E293B'}},
+            gauge={
+                'axis': {'range': [0, 100], 'tickfont': {'color': '#475569'}},
+                'bar': {'color': color},
+                'bgcolor': '#E2E8F0',
+                'borderwidth': 0,
+                'steps': [
+                    {'range': [0, 25], 'color': 'rgba(220, 38, 38, 0.15)'},
+                    {'range': [25, 45], 'color': 'rgba(234, 88, 12, 0.15)'},
+                    {'range': [45, 65], 'color': 'rgba(217, 119, 6, 0.15)'},
+                    {'range': [65, 85], 'color': 'rgba(2, 132, 199, 0.15)'},
+                    {'range': [85, 100], 'color': 'rgba(5, 150, 105, 0.15)'}
+                ]
+            }
+        )],
+        layout=dict(
+            **_CHART_LAYOUT,
+            margin=dict(t=80, b=40, l=40, r=40),
+            height=280
+        )
     )
     
-    st.plotly_chart(fig, use_container_width=True)
+    return fig
 
 
-def render_health_score_gauge(score: float, label: str = "Overall Financial Health"):
+def render_health_score_gauge(
+    score: float,
+    label: str = "Overall Financial Health",
+    key: Optional[str] = None
+):
     """Render a gauge chart for overall health score."""
-    if score >= 85:
-        color = '#059669'
-    elif score >= 65:
-        color = '#0284C7'
-    elif score >= 45:
-        color = '#D97706'
-    elif score >= 25:
-        color = '#EA580C'
-    else:
-        color = '#DC2626'
-    
-    fig = go.Figure(go.Indicator(
-        mode="gauge+number",
-        value=score,
-        domain={'x': [0, 1], 'y': [0, 1]},
-        title={'text': label, 'font': {'size': 16, 'color': '#1E293B'}},
-        number={'font': {'size': 40, 'color': '#1E293B'}},
-        gauge={
-            'axis': {'range': [0, 100], 'tickfont': {'color': '#475569'}},
-            'bar': {'color': color},
-            'bgcolor': '#E2E8F0',
-            'borderwidth': 0,
-            'steps': [
-                {'range': [0, 25], 'color': 'rgba(220, 38, 38, 0.15)'},
-                {'range': [25, 45], 'color': 'rgba(234, 88, 12, 0.15)'},
-                {'range': [45, 65], 'color': 'rgba(217, 119, 6, 0.15)'},
-                {'range': [65, 85], 'color': 'rgba(2, 132, 199, 0.15)'},
-                {'range': [85, 100], 'color': 'rgba(5, 150, 105, 0.15)'}
-            ]
-        }
-    ))
-    
-    fig.update_layout(
-        paper_bgcolor='rgba(255,255,255,0)',
-        plot_bgcolor='rgba(255,255,255,0)',
-        margin=dict(t=80, b=40, l=40, r=40),
-        height=280
+    fig = _build_health_gauge_figure(score, label)
+    st.plotly_chart(
+        fig,
+        use_container_width=True,
+        key=key or f"chart_gauge_{label}",
+        config=_STATIC_CHART_CONFIG
     )
-    
-    st.plotly_chart(fig, use_container_width=True)
+
+
+@lru_cache(maxsize=64)
+def _section_open_html(section_id: str) -> str:
+    """Build the opening tag of a section container."""
+    return f'<div class="section-container" id="{section_id}">'
+
+
+def render_section_html(section_id: str, inner_html: str):
+    """Render a section container around prebuilt HTML as a single element."""
+    st.markdown(f'{_section_open_html(section_id)}{inner_html}\n</div>', unsafe_allow_html=True)
 
 
 def render_section_container_start(section_id: str):
     """Start a section container div."""
-    st.markdown(f'<div class="section-container" id="{section_id}">', unsafe_allow_html=True)
+    st.markdown(_section_open_html(section_id), unsafe_allow_html=True)
 
 
 def render_section_container_end():
@@ -9,45 +9,72 @@ from .client_loader import (
     get_historical_expenses_from_db
 )
 
-import sys
-import os
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+import logging
+
+import streamlit as st
 
 from database.db import database_exists, init_database
 
+logger = logging.getLogger(__name__)
+
+
+@st.cache_resource(show_spinner=False)
+def _db_ready() -> bool:
+    """Create and seed the database if needed; runs once per process."""
+    if not database_exists():
+        init_database(seed_data=True)
+    return True
+
+
+# Client data is read-only once loaded, so it is cached as a shared resource:
+# cache_data would unpickle a fresh copy of every ClientData tree per call.
+@st.cache_resource(show_spinner=False, ttl=300)
+def _load_all_clients() -> dict:
+    return get_all_clients_from_db()
+
+
+@st.cache_resource(show_spinner=False, ttl=300)
+def _load_historical_expenses(client_id: str) -> tuple:
+    return tuple(get_historical_expenses_from_db(client_id))
+
+
+def clear_client_cache():
+    """Drop cached client data so the next read reflects database writes."""
+    _load_all_clients.clear()
+    _load_historical_expenses.clear()
+
 
 def get_all_sample_clients():
-    """Get all clients from the database."""
+    """Get all clients from the database (shared, read-only)."""
     try:
-        if not database_exists():
-            init_database(seed_data=True)
-        
-        db_clients = get_all_clients_from_db()
+        _db_ready()
+        db_clients = _load_all_clients()
         
         if db_clients:
             return db_clients
     except Exception as e:
-        print(f"Warning: Could not load clients from database: {e}")
+        logger.warning("Could not load clients from database: %s", e)
     
     return {}
 
 
-def get_historical_expenses(client_id: str) -> list:
-    """Get historical expenses from the database."""
+def get_historical_expenses(client_id: str) -> tuple:
+    """Get historical expenses from the database (shared, read-only)."""
     try:
-        if database_exists():
-            db_expenses = get_historical_expenses_from_db(client_id)
-            if db_expenses and len(db_expenses) > 0:
-                return db_expenses
+        _db_ready()
+        db_expenses = _load_historical_expenses(client_id)
+        if db_expenses and len(db_expenses) > 0:
+            return db_expenses
     except Exception as e:
-        print(f"Warning: Could not load historical expenses from database: {e}")
+        logger.warning("Could not load historical expenses from database: %s", e)
     
-    return []
+    return ()
 
 
 __all__ = [
     'get_all_sample_clients',
     'get_historical_expenses',
+    'clear_client_cache',
     'load_client_data',
     'get_all_clients_from_db',
     'get_historical_expenses_from_db'
@@ -5,12 +5,14 @@ Provides SQLite database connection and query utilities.
 
 from .db import (
     get_connection,
+    close_connections,
     init_database,
     database_exists,
     execute_query,
     fetch_one,
     fetch_all,
     insert_record,
+    insert_records,
     update_record,
     delete_record,
     get_all_clients,
@@ -25,17 +27,32 @@ from .db import (
     get_client_estate_planning,
     get_client_portfolio_metrics,
     get_client_transactions,
+    get_holdings_for_accounts,
+    get_holding_totals_for_accounts,
+    get_accounts_for_clients,
+    get_liabilities_for_clients,
+    get_income_for_clients,
+    get_goals_for_clients,
+    get_goal_current_amounts,
+    get_insurance_for_clients,
+    get_estate_planning_for_clients,
+    get_portfolio_metrics_for_clients,
+    get_transactions_for_clients,
+    get_recent_debits_for_clients,
+    get_clients_bundle,
     get_document_content,
 )
 
 __all__ = [
     "get_connection",
+    "close_connections",
     "init_database",
     "database_exists",
     "execute_query",
     "fetch_one",
     "fetch_all",
     "insert_record",
+    "insert_records",
     "update_record",
     "delete_record",
     "get_all_clients",
@@ -50,5 +67,18 @@ __all__ = [
     "get_client_estate_planning",
     "get_client_portfolio_metrics",
     "get_client_transactions",
+    "get_holdings_for_accounts",
+    "get_holding_totals_for_accounts",
+    "get_accounts_for_clients",
+    "get_liabilities_for_clients",
+    "get_income_for_clients",
+    "get_goals_for_clients",
+    "get_goal_current_amounts",
+    "get_insurance_for_clients",
+    "get_estate_planning_for_clients",
+    "get_portfolio_metrics_for_clients",
+    "get_transactions_for_clients",
+    "get_recent_debits_for_clients",
+    "get_clients_bundle",
     "get_document_content",
 ]
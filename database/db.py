@@ -4,10 +4,13 @@ Provides SQLite database connection and query utilities.
 """
 
 import sqlite3
+import json
 import os
 from pathlib import Path
 from typing import Any, Dict, List, Optional, Tuple
 from contextlib import contextmanager
+from functools import lru_cache
+import threading
 import uuid
 from datetime import datetime
 
@@ -35,11 +38,41 @@ def get_connection(db_path: Optional[str] = None) -> sqlite3.Connection:
     return conn
 
 
+# Connections kept open for reuse, per thread and keyed by database path
+_local = threading.local()
+
+
+def _get_thread_connection(path: str) -> sqlite3.Connection:
+    """Return this thread's open connection to path, creating it on first use."""
+    connections = getattr(_local, 'connections', None)
+    if connections is None:
+        connections = _local.connections = {}
+    
+    conn = connections.get(path)
+    if conn is None:
+        conn = connections[path] = get_connection(path)
+    return conn
+
+
+def close_connections() -> None:
+    """
+    Close the connections cached for the current thread.
+    
+    The next query reconnects. Call this before deleting or replacing the
+    database file so the thread does not keep reading the old one.
+    """
+    for conn in getattr(_local, 'connections', {}).values():
+        conn.close()
+    _local.connections = {}
+
+
 @contextmanager
 def get_db_context(db_path: Optional[str] = None):
     """
     Context manager for database connections.
-    Automatically handles commit/rollback and connection closing.
+    Automatically handles commit/rollback. The connection is cached per
+    thread and left open, so later queries skip the connect and reuse
+    SQLite's page and statement caches.
     
     Args:
         db_path: Optional path to the database file
@@ -47,15 +80,13 @@ def get_db_context(db_path: Optional[str] = None):
     Yields:
         sqlite3.Connection: Database connection object
     """
-    conn = get_connection(db_path)
+    conn = _get_thread_connection(db_path or str(DB_PATH))
     try:
         yield conn
         conn.commit()
     except Exception as e:
         conn.rollback()
         raise e
-    finally:
-        conn.close()
 
 
 def init_database(db_path: Optional[str] = None, seed_data: bool = False) -> bool:
@@ -91,13 +122,61 @@ def init_database(db_path: Optional[str] = None, seed_data: bool = False) -> boo
         return False
 
 
+# Single-column client_id indexes replaced by the composite indexes in
+# schema.sql, which also cover each query's ORDER BY
+_SUPERSEDED_INDEXES = (
+    'idx_transactions_client',
+    'idx_liabilities_client',
+    'idx_income_client',
+    'idx_insurance_client',
+    'idx_portfolio_metrics_client',
+    'idx_goals_client',
+    'idx_documents_client',
+)
+_COMPOSITE_INDEXES = (
+    "CREATE INDEX IF NOT EXISTS idx_transactions_client_date ON transactions(client_id, date DESC)",
+    "CREATE INDEX IF NOT EXISTS idx_liabilities_client_balance ON liabilities(client_id, balance DESC)",
+    "CREATE INDEX IF NOT EXISTS idx_income_client_amount ON income(client_id, amount DESC)",
+    "CREATE INDEX IF NOT EXISTS idx_insurance_client_effective "
+    "ON insurance_coverage(client_id, effective_date DESC)",
+    "CREATE INDEX IF NOT EXISTS idx_portfolio_metrics_client_snapshot "
+    "ON portfolio_metrics(client_id, snapshot_date DESC)",
+    "CREATE INDEX IF NOT EXISTS idx_goals_client_priority ON goals(client_id, priority, target_date)",
+    "CREATE INDEX IF NOT EXISTS idx_documents_client_uploaded ON documents(client_id, upload_time DESC)",
+)
+
+
+# Number of the last migration in _run_migrations, stored in PRAGMA user_version
+_SCHEMA_VERSION = 2
+
+
 def _run_migrations(conn):
-    """Apply any missing schema migrations to an existing database."""
-    # Migration: add file_content BLOB to documents table
-    cursor = conn.execute("PRAGMA table_info(documents)")
-    columns = [row[1] for row in cursor.fetchall()]
-    if 'file_content' not in columns:
-        conn.execute("ALTER TABLE documents ADD COLUMN file_content BLOB")
+    """
+    Apply any missing schema migrations to an existing database.
+    
+    PRAGMA user_version records the last migration applied, so each
+    numbered block runs at most once per database. The blocks stay
+    idempotent because a fresh database already has the current schema
+    from schema.sql but starts at version 0.
+    """
+    version = conn.execute("PRAGMA user_version").fetchone()[0]
+    
+    # Migration 1: add file_content BLOB to documents table
+    if version < 1:
+        cursor = conn.execute("PRAGMA table_info(documents)")
+        columns = [row[1] for row in cursor.fetchall()]
+        if 'file_content' not in columns:
+            conn.execute("ALTER TABLE documents ADD COLUMN file_content BLOB")
+    
+    # Migration 2: composite (client_id, sort column) indexes
+    if version < 2:
+        for statement in _COMPOSITE_INDEXES:
+            conn.execute(statement)
+        for index_name in _SUPERSEDED_INDEXES:
+            conn.execute(f"DROP INDEX IF EXISTS {index_name}")
+    
+    if version < _SCHEMA_VERSION:
+        conn.execute(f"PRAGMA user_version = {_SCHEMA_VERSION}")
 
 
 def execute_query(
@@ -124,7 +203,8 @@ def execute_query(
 def fetch_one(
     query: str, 
     params: Optional[Tuple] = None, 
-    db_path: Optional[str] = None
+    db_path: Optional[str] = None,
+    as_dict: bool = True
 ) -> Optional[Dict[str, Any]]:
     """
     Fetch a single row from a SELECT query.
@@ -133,6 +213,8 @@ def fetch_one(
         query: SQL SELECT query string
         params: Optional tuple of parameters
         db_path: Optional path to the database file
+        as_dict: Copy the row into a dict. Pass False to get the
+            sqlite3.Row itself when only row['col'] access is needed
         
     Returns:
         Optional[Dict]: Row as dictionary or None if not found
@@ -140,13 +222,16 @@ def fetch_one(
     with get_db_context(db_path) as conn:
         cursor = conn.execute(query, params or ())
         row = cursor.fetchone()
-        return dict(row) if row else None
+        if row is None or not as_dict:
+            return row
+        return dict(row)
 
 
 def fetch_all(
     query: str, 
     params: Optional[Tuple] = None, 
-    db_path: Optional[str] = None
+    db_path: Optional[str] = None,
+    as_dict: bool = True
 ) -> List[Dict[str, Any]]:
     """
     Fetch all rows from a SELECT query.
@@ -155,6 +240,8 @@ def fetch_all(
         query: SQL SELECT query string
         params: Optional tuple of parameters
         db_path: Optional path to the database file
+        as_dict: Copy each row into a dict. Pass False to get the
+            sqlite3.Row objects when only row['col'] access is needed
         
     Returns:
         List[Dict]: List of rows as dictionaries
@@ -162,7 +249,7 @@ def fetch_all(
     with get_db_context(db_path) as conn:
         cursor = conn.execute(query, params or ())
         rows = cursor.fetchall()
-        return [dict(row) for row in rows]
+        return [dict(row) for row in rows] if as_dict else rows
 
 
 def generate_uuid() -> str:
@@ -170,6 +257,20 @@ def generate_uuid() -> str:
     return str(uuid.uuid4())
 
 
+@lru_cache(maxsize=128)
+def _insert_sql(table: str, columns: Tuple[str, ...]) -> str:
+    """Build the INSERT statement for a table and column order (memoized)."""
+    placeholders = ', '.join(['?' for _ in columns])
+    return f"INSERT INTO {table} ({', '.join(columns)}) VALUES ({placeholders})"
+
+
+@lru_cache(maxsize=128)
+def _update_sql(table: str, columns: Tuple[str, ...]) -> str:
+    """Build the UPDATE-by-id statement for a table and column order (memoized)."""
+    set_clause = ', '.join([f"{k} = ?" for k in columns])
+    return f"UPDATE {table} SET {set_clause} WHERE id = ?"
+
+
 def insert_record(
     table: str, 
     data: Dict[str, Any], 
@@ -190,9 +291,7 @@ def insert_record(
     if 'id' not in data:
         data['id'] = generate_uuid()
     
-    columns = ', '.join(data.keys())
-    placeholders = ', '.join(['?' for _ in data])
-    query = f"INSERT INTO {table} ({columns}) VALUES ({placeholders})"
+    query = _insert_sql(table, tuple(data))
     
     with get_db_context(db_path) as conn:
         conn.execute(query, tuple(data.values()))
@@ -200,6 +299,42 @@ def insert_record(
     return data['id']
 
 
+def insert_records(
+    table: str, 
+    rows: List[Dict[str, Any]], 
+    db_path: Optional[str] = None
+) -> List[str]:
+    """
+    Insert several records into a table in a single transaction.
+    
+    All rows must have the same columns. They are written with one
+    executemany and committed once, instead of one commit per row.
+    
+    Args:
+        table: Table name
+        rows: Dictionaries of column names and values
+        db_path: Optional path to the database file
+        
+    Returns:
+        List[str]: The IDs of the inserted records, in input order
+    """
+    if not rows:
+        return []
+    
+    # Generate UUIDs for rows without an id
+    for data in rows:
+        if 'id' not in data:
+            data['id'] = generate_uuid()
+    
+    columns = tuple(rows[0])
+    query = _insert_sql(table, columns)
+    
+    with get_db_context(db_path) as conn:
+        conn.executemany(query, [tuple(data[c] for c in columns) for data in rows])
+    
+    return [data['id'] for data in rows]
+
+
 def update_record(
     table: str, 
     record_id: str, 
@@ -221,8 +356,7 @@ def update_record(
     # Add updated_at timestamp if the table has it
     data['updated_at'] = datetime.now().isoformat()
     
-    set_clause = ', '.join([f"{k} = ?" for k in data.keys()])
-    query = f"UPDATE {table} SET {set_clause} WHERE id = ?"
+    query = _update_sql(table, tuple(data))
     params = tuple(data.values()) + (record_id,)
     
     return execute_query(query, params, db_path)
@@ -299,6 +433,82 @@ def get_account_holdings(account_id: str, db_path: Optional[str] = None) -> List
     return fetch_all(query, (account_id,), db_path)
 
 
+def get_holdings_for_accounts(
+    account_ids: List[str],
+    db_path: Optional[str] = None
+) -> Dict[str, List[Dict[str, Any]]]:
+    """
+    Get holdings for several accounts in one query.
+
+    Args:
+        account_ids: IDs of the accounts to fetch holdings for
+        db_path: Optional path to the database file
+
+    Returns:
+        Dict[str, List[Dict]]: Holdings keyed by account ID, each list in the
+        same order as get_account_holdings. Accounts without holdings map to
+        an empty list.
+    """
+    query = """
+        SELECT h.*, s.name as security_name, s.security_type, s.expense_ratio
+        FROM holdings h
+        JOIN securities s ON h.security_id = s.id
+        WHERE h.account_id IN (SELECT value FROM json_each(?))
+        ORDER BY h.account_id, s.name
+    """
+    return _fetch_grouped(query, account_ids, 'account_id', db_path=db_path)
+
+
+def get_holding_totals_for_accounts(
+    account_ids: List[str],
+    db_path: Optional[str] = None
+) -> Dict[str, Dict[str, float]]:
+    """
+    Total cost basis per asset class for several accounts.
+
+    Holdings are classified in SQL by security type, and stock/ETF/fund
+    holdings additionally by name (bond, international and REIT funds).
+    The asset classes match the PortfolioAllocation fields.
+
+    Args:
+        account_ids: IDs of the accounts to total
+        db_path: Optional path to the database file
+
+    Returns:
+        Dict[str, Dict[str, float]]: Per account ID, cost basis keyed by asset
+        class. Accounts without holdings map to an empty dict.
+    """
+    query = """
+        SELECT h.account_id,
+               CASE
+                   WHEN s.security_type = 'cash' THEN 'cash'
+                   WHEN s.security_type = 'crypto' THEN 'crypto'
+                   WHEN s.security_type = 'bond' THEN 'bonds'
+                   WHEN s.security_type = 'real_estate' THEN 'real_estate'
+                   WHEN s.security_type IN ('stock', 'etf', 'mutual_fund') THEN
+                       CASE
+                           WHEN s.name LIKE '%bond%' OR s.name LIKE '%bnd%' THEN 'bonds'
+                           WHEN s.name LIKE '%international%' OR s.name LIKE '%vxus%'
+                                OR s.name LIKE '%intl%' THEN 'international_stocks'
+                           WHEN s.name LIKE '%real estate%' OR s.name LIKE '%reit%' THEN 'real_estate'
+                           ELSE 'us_stocks'
+                       END
+                   ELSE 'alternatives'
+               END as asset_class,
+               COALESCE(SUM(h.cost_basis), 0) as total
+        FROM holdings h
+        JOIN securities s ON h.security_id = s.id
+        WHERE h.account_id IN (SELECT value FROM json_each(?))
+        GROUP BY h.account_id, asset_class
+    """
+    return {
+        account_id: {row['asset_class']: row['total'] for row in rows}
+        for account_id, rows in _fetch_grouped(
+            query, account_ids, 'account_id', db_path=db_path, as_dict=False
+        ).items()
+    }
+
+
 # ============================================
 # Financial data queries
 # ============================================
@@ -370,6 +580,271 @@ def get_client_transactions(
     )
 
 
+# ============================================
+# Multi-client queries
+# ============================================
+
+def _fetch_grouped(
+    query: str,
+    ids: List[str],
+    key: str,
+    params: Tuple = (),
+    db_path: Optional[str] = None,
+    as_dict: bool = True
+) -> Dict[str, List[Dict[str, Any]]]:
+    """
+    Run a query filtered by a list of IDs and bucket rows by a column.
+
+    The ID list is bound as a single JSON array parameter, which the query
+    expands with ``IN (SELECT value FROM json_each(?))``; any extra params
+    are bound after it. Keeping the SQL text independent of the number of
+    IDs lets sqlite3 reuse the prepared statement from its per-connection
+    cache. Every requested ID is present in the result, mapped to an empty
+    list when no rows match. as_dict is passed through to fetch_all.
+    """
+    grouped = {item_id: [] for item_id in ids}
+    if not ids:
+        return grouped
+
+    rows = fetch_all(query, (json.dumps(ids),) + params, db_path, as_dict)
+    for row in rows:
+        grouped[row[key]].append(row)
+    return grouped
+
+
+def _fetch_latest(
+    query: str,
+    ids: List[str],
+    key: str,
+    db_path: Optional[str] = None
+) -> Dict[str, Optional[Dict[str, Any]]]:
+    """Like _fetch_grouped, but keep only the first row per ID (or None)."""
+    return {
+        item_id: rows[0] if rows else None
+        for item_id, rows in _fetch_grouped(query, ids, key, db_path=db_path).items()
+    }
+
+
+def get_accounts_for_clients(
+    client_ids: List[str],
+    db_path: Optional[str] = None
+) -> Dict[str, List[Dict[str, Any]]]:
+    """Get accounts for several clients, keyed by owning client ID."""
+    query = """
+        SELECT a.*, ao.client_id as owner_client_id, ao.ownership_type,
+               at.tax_advantaged, at.is_roth, at.is_liquid
+        FROM accounts a
+        JOIN account_owners ao ON a.id = ao.account_id
+        JOIN account_types at ON a.account_type_name = at.account_type_name
+        WHERE ao.client_id IN (SELECT value FROM json_each(?))
+        ORDER BY ao.client_id, a.account_name
+    """
+    return _fetch_grouped(query, client_ids, 'owner_client_id', db_path=db_path)
+
+
+def get_liabilities_for_clients(
+    client_ids: List[str],
+    db_path: Optional[str] = None
+) -> Dict[str, List[Dict[str, Any]]]:
+    """Get liabilities for several clients, keyed by client ID."""
+    return _fetch_grouped(
+        "SELECT * FROM liabilities "
+        "WHERE client_id IN (SELECT value FROM json_each(?)) "
+        "ORDER BY client_id, balance DESC",
+        client_ids, 'client_id', db_path=db_path
+    )
+
+
+def get_income_for_clients(
+    client_ids: List[str],
+    db_path: Optional[str] = None
+) -> Dict[str, List[Dict[str, Any]]]:
+    """Get income sources for several clients, keyed by client ID."""
+    return _fetch_grouped(
+        "SELECT * FROM income "
+        "WHERE client_id IN (SELECT value FROM json_each(?)) "
+        "ORDER BY client_id, amount DESC",
+        client_ids, 'client_id', db_path=db_path
+    )
+
+
+def get_goals_for_clients(
+    client_ids: List[str],
+    db_path: Optional[str] = None
+) -> Dict[str, List[Dict[str, Any]]]:
+    """Get goals for several clients, keyed by client ID."""
+    return _fetch_grouped(
+        "SELECT * FROM goals "
+        "WHERE client_id IN (SELECT value FROM json_each(?)) "
+        "ORDER BY client_id, priority, target_date",
+        client_ids, 'client_id', db_path=db_path
+    )
+
+
+def get_goal_current_amounts(
+    client_ids: List[str],
+    db_path: Optional[str] = None
+) -> Dict[str, float]:
+    """
+    Amount currently saved towards each goal of several clients.
+
+    Each allocated account contributes its total cost basis scaled by the
+    goal's allocation percentage (a zero percentage counts as 100).
+
+    Returns:
+        Dict[str, float]: Saved amount keyed by goal ID; goals without
+        allocated holdings are omitted.
+    """
+    if not client_ids:
+        return {}
+
+    query = """
+        SELECT g.id as goal_id,
+               COALESCE(SUM(
+                   h.cost_basis * COALESCE(NULLIF(gaa.allocation_percentage, 0), 100) / 100.0
+               ), 0) as current_amount
+        FROM goals g
+        JOIN goal_account_allocations gaa ON gaa.goal_id = g.id
+        JOIN holdings h ON h.account_id = gaa.account_id
+        JOIN securities s ON h.security_id = s.id
+        WHERE g.client_id IN (SELECT value FROM json_each(?))
+        GROUP BY g.id
+    """
+    rows = fetch_all(query, (json.dumps(client_ids),), db_path, as_dict=False)
+    return {row['goal_id']: row['current_amount'] for row in rows}
+
+
+def get_insurance_for_clients(
+    client_ids: List[str],
+    db_path: Optional[str] = None
+) -> Dict[str, Optional[Dict[str, Any]]]:
+    """Get the most recent insurance coverage for several clients."""
+    return _fetch_latest(
+        "SELECT * FROM insurance_coverage "
+        "WHERE client_id IN (SELECT value FROM json_each(?)) "
+        "ORDER BY client_id, effective_date DESC",
+        client_ids, 'client_id', db_path=db_path
+    )
+
+
+def get_estate_planning_for_clients(
+    client_ids: List[str],
+    db_path: Optional[str] = None
+) -> Dict[str, Optional[Dict[str, Any]]]:
+    """Get estate planning status for several clients."""
+    return _fetch_latest(
+        "SELECT * FROM estate_planning "
+        "WHERE client_id IN (SELECT value FROM json_each(?))",
+        client_ids, 'client_id', db_path=db_path
+    )
+
+
+def get_portfolio_metrics_for_clients(
+    client_ids: List[str],
+    db_path: Optional[str] = None
+) -> Dict[str, Optional[Dict[str, Any]]]:
+    """Get the latest portfolio metrics for several clients."""
+    return _fetch_latest(
+        "SELECT * FROM portfolio_metrics "
+        "WHERE client_id IN (SELECT value FROM json_each(?)) "
+        "ORDER BY client_id, snapshot_date DESC",
+        client_ids, 'client_id', db_path=db_path
+    )
+
+
+def get_transactions_for_clients(
+    client_ids: List[str],
+    limit: int = 50,
+    db_path: Optional[str] = None
+) -> Dict[str, List[Dict[str, Any]]]:
+    """Get the most recent transactions for several clients, up to limit each."""
+    query = """
+        SELECT * FROM (
+            SELECT t.*, ROW_NUMBER() OVER (
+                PARTITION BY t.client_id ORDER BY t.date DESC
+            ) as row_num
+            FROM transactions t
+            WHERE t.client_id IN (SELECT value FROM json_each(?))
+        )
+        WHERE row_num <= ?
+        ORDER BY client_id, row_num
+    """
+    return _fetch_grouped(query, client_ids, 'client_id', (limit,), db_path)
+
+
+def get_recent_debits_for_clients(
+    client_ids: List[str],
+    limit: int = 50,
+    db_path: Optional[str] = None
+) -> Dict[str, Dict[Optional[str], float]]:
+    """
+    Total debits per transaction type over each client's most recent
+    transactions (the same rows get_transactions_for_clients returns).
+
+    Returns:
+        Dict[str, Dict]: Per client ID, debit totals keyed by transaction
+        type. Clients without debits map to an empty dict.
+    """
+    query = """
+        SELECT client_id, type, COALESCE(SUM(amount), 0) as total
+        FROM (
+            SELECT t.client_id, t.type, t.amount, t.direction, ROW_NUMBER() OVER (
+                PARTITION BY t.client_id ORDER BY t.date DESC
+            ) as row_num
+            FROM transactions t
+            WHERE t.client_id IN (SELECT value FROM json_each(?))
+        )
+        WHERE row_num <= ? AND direction = 'debit'
+        GROUP BY client_id, type
+    """
+    return {
+        client_id: {row['type']: row['total'] for row in rows}
+        for client_id, rows in _fetch_grouped(
+            query, client_ids, 'client_id', (limit,), db_path, as_dict=False
+        ).items()
+    }
+
+
+def get_clients_bundle(
+    client_ids: List[str],
+    transaction_limit: int = 50,
+    db_path: Optional[str] = None
+) -> Dict[str, Dict[str, Any]]:
+    """
+    Fetch all the financial data needed to build several clients.
+
+    Runs each multi-client query once, back to back on the thread's cached
+    connection, so a whole batch costs a fixed number of statements.
+
+    Args:
+        client_ids: IDs of the clients to fetch
+        transaction_limit: Most recent transactions to total per client
+        db_path: Optional path to the database file
+
+    Returns:
+        Dict[str, Dict]: Results keyed by name. 'accounts', 'liabilities',
+        'income' and 'goals' hold row lists per client ID; 'insurance',
+        'estate_planning' and 'portfolio_metrics' hold the latest row (or
+        None) per client ID; 'recent_debits' holds debit totals by type
+        over the latest transaction_limit transactions per client ID;
+        'holding_totals' is keyed by account ID and 'goal_amounts' by goal ID.
+    """
+    accounts = get_accounts_for_clients(client_ids, db_path)
+    account_ids = list({account['id'] for rows in accounts.values() for account in rows})
+    return {
+        'accounts': accounts,
+        'holding_totals': get_holding_totals_for_accounts(account_ids, db_path),
+        'liabilities': get_liabilities_for_clients(client_ids, db_path),
+        'income': get_income_for_clients(client_ids, db_path),
+        'goals': get_goals_for_clients(client_ids, db_path),
+        'goal_amounts': get_goal_current_amounts(client_ids, db_path),
+        'insurance': get_insurance_for_clients(client_ids, db_path),
+        'estate_planning': get_estate_planning_for_clients(client_ids, db_path),
+        'portfolio_metrics': get_portfolio_metrics_for_clients(client_ids, db_path),
+        'recent_debits': get_recent_debits_for_clients(client_ids, transaction_limit, db_path),
+    }
+
+
 # ============================================
 # Profile update queries
 # ============================================
@@ -424,18 +899,26 @@ def delete_dependent(dependent_id: str, db_path: Optional[str] = None) -> int:
 # Document queries
 # ============================================
 
+# Document metadata columns; file_content is read separately with
+# get_document_content so listings do not load every file into memory
+_DOCUMENT_COLUMNS = (
+    "id, client_id, document_type, file_name, file_hash, "
+    "storage_path, upload_time, uploaded_by"
+)
+
+
 def get_client_documents(client_id: str, db_path: Optional[str] = None) -> List[Dict[str, Any]]:
-    """Get all documents for a client."""
+    """Get all documents for a client (metadata only)."""
     return fetch_all(
-        "SELECT * FROM documents WHERE client_id = ? ORDER BY upload_time DESC",
+        f"SELECT {_DOCUMENT_COLUMNS} FROM documents WHERE client_id = ? ORDER BY upload_time DESC",
         (client_id,),
         db_path
     )
 
 
 def get_document_by_id(document_id: str, db_path: Optional[str] = None) -> Optional[Dict[str, Any]]:
-    """Get a document by ID."""
-    return fetch_one("SELECT * FROM documents WHERE id = ?", (document_id,), db_path)
+    """Get a document by ID (metadata only)."""
+    return fetch_one(f"SELECT {_DOCUMENT_COLUMNS} FROM documents WHERE id = ?", (document_id,), db_path)
 
 
 def add_document(
@@ -456,29 +939,75 @@ def delete_document(document_id: str, db_path: Optional[str] = None) -> int:
 def get_document_by_hash(file_hash: str, client_id: str, db_path: Optional[str] = None) -> Optional[Dict[str, Any]]:
     """Check if a document with the same hash already exists for a client."""
     return fetch_one(
-        "SELECT * FROM documents WHERE file_hash = ? AND client_id = ?",
+        f"SELECT {_DOCUMENT_COLUMNS} FROM documents WHERE file_hash = ? AND client_id = ?",
         (file_hash, client_id),
         db_path
     )
 
 
 def get_document_content(document_id: str, db_path: Optional[str] = None) -> Optional[bytes]:
-    """Retrieve the binary file content for a document from the database."""
+    """
+    Retrieve the binary file content for a document from the database.
+    
+    On Python 3.11+ the BLOB is read straight from SQLite with blobopen,
+    so the bytes are not first materialized in a result row.
+    """
     with get_db_context(db_path) as conn:
-        cursor = conn.execute(
-            "SELECT file_content FROM documents WHERE id = ?",
+        if not hasattr(conn, 'blobopen'):
+            row = conn.execute(
+                "SELECT file_content FROM documents WHERE id = ?",
+                (document_id,)
+            ).fetchone()
+            return bytes(row['file_content']) if row and row['file_content'] else None
+        
+        row = conn.execute(
+            "SELECT rowid, length(file_content) as size FROM documents WHERE id = ?",
             (document_id,)
-        )
-        row = cursor.fetchone()
-        if row and row['file_content']:
-            return bytes(row['file_content'])
-    return None
+        ).fetchone()
+        if not row or not row['size']:
+            return None
+        with conn.blobopen('documents', 'file_content', row['rowid'], readonly=True) as blob:
+            return blob.read()
 
 
 # ============================================
 # Aggregation queries
 # ============================================
 
+def get_client_monthly_debits(
+    client_id: str,
+    limit: int = 500,
+    db_path: Optional[str] = None
+) -> Dict[str, float]:
+    """
+    Total debits per month over a client's most recent transactions.
+    
+    Args:
+        client_id: Client ID
+        limit: Number of most recent transactions to consider
+        db_path: Optional path to the database file
+        
+    Returns:
+        Dict[str, float]: Debit totals keyed by 'YYYY-MM', in month order
+    """
+    query = """
+        SELECT substr(date, 1, 7) as month, SUM(amount) as total
+        FROM (
+            SELECT date, amount, direction
+            FROM transactions
+            WHERE client_id = ?
+            ORDER BY date DESC
+            LIMIT ?
+        )
+        WHERE direction = 'debit'
+        AND length(date) >= 10 AND substr(date, 5, 1) = '-' AND substr(date, 8, 1) = '-'
+        GROUP BY month
+        ORDER BY month
+    """
+    rows = fetch_all(query, (client_id, limit), db_path, as_dict=False)
+    return {row['month']: row['total'] for row in rows}
+
+
 def get_client_total_assets(client_id: str, db_path: Optional[str] = None) -> float:
     """Calculate total assets for a client across all accounts."""
     query = """
@@ -488,7 +1017,7 @@ def get_client_total_assets(client_id: str, db_path: Optional[str] = None) -> fl
         JOIN account_owners ao ON a.id = ao.account_id
         WHERE ao.client_id = ?
     """
-    result = fetch_one(query, (client_id,), db_path)
+    result = fetch_one(query, (client_id,), db_path, as_dict=False)
     return result['total_assets'] if result else 0.0
 
 
@@ -499,7 +1028,7 @@ def get_client_total_liabilities(client_id: str, db_path: Optional[str] = None)
         FROM liabilities
         WHERE client_id = ?
     """
-    result = fetch_one(query, (client_id,), db_path)
+    result = fetch_one(query, (client_id,), db_path, as_dict=False)
     return result['total_liabilities'] if result else 0.0
 
 
@@ -524,7 +1053,7 @@ def get_client_annual_income(client_id: str, db_path: Optional[str] = None) -> f
         WHERE client_id = ?
         AND (end_date IS NULL OR end_date >= date('now'))
     """
-    result = fetch_one(query, (client_id,), db_path)
+    result = fetch_one(query, (client_id,), db_path, as_dict=False)
     return result['annual_income'] if result else 0.0
 
 
@@ -551,6 +1080,7 @@ def reset_database(db_path: Optional[str] = None) -> bool:
     """
     path = db_path or str(DB_PATH)
     try:
+        close_connections()
         if os.path.exists(path):
             os.remove(path)
         return init_database(db_path)
@@ -254,16 +254,16 @@ CREATE INDEX IF NOT EXISTS idx_account_owners_client ON account_owners(client_id
 CREATE INDEX IF NOT EXISTS idx_account_owners_account ON account_owners(account_id);
 CREATE INDEX IF NOT EXISTS idx_holdings_account ON holdings(account_id);
 CREATE INDEX IF NOT EXISTS idx_holdings_security ON holdings(security_id);
-CREATE INDEX IF NOT EXISTS idx_transactions_client ON transactions(client_id);
+CREATE INDEX IF NOT EXISTS idx_transactions_client_date ON transactions(client_id, date DESC);
 CREATE INDEX IF NOT EXISTS idx_transactions_account ON transactions(account_id);
 CREATE INDEX IF NOT EXISTS idx_transactions_date ON transactions(date);
-CREATE INDEX IF NOT EXISTS idx_liabilities_client ON liabilities(client_id);
-CREATE INDEX IF NOT EXISTS idx_income_client ON income(client_id);
-CREATE INDEX IF NOT EXISTS idx_insurance_client ON insurance_coverage(client_id);
-CREATE INDEX IF NOT EXISTS idx_portfolio_metrics_client ON portfolio_metrics(client_id);
-CREATE INDEX IF NOT EXISTS idx_goals_client ON goals(client_id);
+CREATE INDEX IF NOT EXISTS idx_liabilities_client_balance ON liabilities(client_id, balance DESC);
+CREATE INDEX IF NOT EXISTS idx_income_client_amount ON income(client_id, amount DESC);
+CREATE INDEX IF NOT EXISTS idx_insurance_client_effective ON insurance_coverage(client_id, effective_date DESC);
+CREATE INDEX IF NOT EXISTS idx_portfolio_metrics_client_snapshot ON portfolio_metrics(client_id, snapshot_date DESC);
+CREATE INDEX IF NOT EXISTS idx_goals_client_priority ON goals(client_id, priority, target_date);
 CREATE INDEX IF NOT EXISTS idx_goal_allocations_goal ON goal_account_allocations(goal_id);
 CREATE INDEX IF NOT EXISTS idx_goal_allocations_account ON goal_account_allocations(account_id);
 CREATE INDEX IF NOT EXISTS idx_estate_planning_client ON estate_planning(client_id);
-CREATE INDEX IF NOT EXISTS idx_documents_client ON documents(client_id);
+CREATE INDEX IF NOT EXISTS idx_documents_client_uploaded ON documents(client_id, upload_time DESC);
 CREATE INDEX IF NOT EXISTS idx_dependents_client ON dependents(client_id);
@@ -17,6 +17,12 @@ class CashFlowBehavior:
         self.data = client_data
         # Historical monthly expenses for trend analysis (last 12-24 months)
         self.historical_expenses = historical_expenses or []
+        # Average monthly expenses over the first 12 months, shared by the delta
+        # calculations and lifestyle creep; None without a full year of data
+        self.prior_year_avg = (
+            sum(self.historical_expenses[:12]) / 12
+            if len(self.historical_expenses) >= 12 else None
+        )
     
     def savings_rate(self) -> MetricResult:
         """
@@ -35,9 +41,9 @@ class CashFlowBehavior:
         # Calculate delta from last year if we have historical data
         delta = None
         delta_is_positive = None
-        if len(self.historical_expenses) >= 12:
+        if self.prior_year_avg is not None:
             # Calculate last year's average expenses
-            last_year_avg_expenses = sum(self.historical_expenses[:12]) / 12
+            last_year_avg_expenses = self.prior_year_avg
             last_year_savings = monthly_income - last_year_avg_expenses
             last_year_rate = (last_year_savings / monthly_income) * 100 if monthly_income > 0 else 0
             delta = abs(rate - last_year_rate)
@@ -99,8 +105,8 @@ class CashFlowBehavior:
         # Calculate delta - estimate fixed costs from historical data (roughly 70% of total)
         delta = None
         delta_is_positive = None
-        if len(self.historical_expenses) >= 12:
-            last_year_total = sum(self.historical_expenses[:12]) / 12
+        if self.prior_year_avg is not None:
+            last_year_total = self.prior_year_avg
             last_year_fixed_est = last_year_total * 0.7  # Estimate fixed portion
             last_year_ratio = (last_year_fixed_est / monthly_income) * 100 if monthly_income > 0 else 0
             delta = abs(ratio - last_year_ratio)
@@ -153,8 +159,8 @@ class CashFlowBehavior:
         # Calculate delta - estimate discretionary from historical data (roughly 30% of total)
         delta = None
         delta_is_positive = None
-        if len(self.historical_expenses) >= 12:
-            last_year_total = sum(self.historical_expenses[:12]) / 12
+        if self.prior_year_avg is not None:
+            last_year_total = self.prior_year_avg
             last_year_disc_est = last_year_total * 0.3  # Estimate discretionary portion
             last_year_ratio = (last_year_disc_est / monthly_income) * 100 if monthly_income > 0 else 0
             delta = abs(ratio - last_year_ratio)
@@ -226,8 +232,8 @@ class CashFlowBehavior:
         # Calculate delta based on historical fixed expenses
         delta = None
         delta_is_positive = None
-        if len(self.historical_expenses) >= 12:
-            last_year_total = sum(self.historical_expenses[:12]) / 12
+        if self.prior_year_avg is not None:
+            last_year_total = self.prior_year_avg
             last_year_fixed_est = last_year_total * 0.7
             last_year_guilt_free = monthly_income - last_year_fixed_est - target_savings
             delta = abs(guilt_free - last_year_guilt_free)
@@ -283,7 +289,7 @@ class CashFlowBehavior:
         
         # Calculate expense growth rate (YoY if we have enough data)
         if len(self.historical_expenses) >= 24:
-            old_avg = sum(self.historical_expenses[:12]) / 12
+            old_avg = self.prior_year_avg
             new_avg = sum(self.historical_expenses[-12:]) / 12
         else:
             old_avg = sum(self.historical_expenses[:6]) / 6
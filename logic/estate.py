@@ -16,6 +16,8 @@ class EstateReadiness:
     
     def __init__(self, client_data: ClientData):
         self.data = client_data
+        # Reference date for time-based metrics, read once per calculator
+        self.today = date.today()
     
     def estate_planning_score(self) -> MetricResult:
         """
@@ -46,7 +48,7 @@ class EstateReadiness:
         
         # Check if will is outdated (over 5 years)
         if estate.has_will and estate.will_last_updated:
-            years_old = (date.today() - estate.will_last_updated).days / 365
+            years_old = (self.today - estate.will_last_updated).days / 365
             if years_old > 5:
                 score -= 10
                 missing.append("Will needs update (>5 years old)")
@@ -72,7 +74,7 @@ class EstateReadiness:
         if not estate.has_healthcare_directive:
             recommendations.append("Create healthcare directive/living will")
         if estate.has_will and estate.will_last_updated:
-            years_old = (date.today() - estate.will_last_updated).days / 365
+            years_old = (self.today - estate.will_last_updated).days / 365
             if years_old > 3:
                 recommendations.append(f"Review will (last updated {years_old:.0f} years ago)")
         if self.data.net_worth > 1000000 and not estate.has_trust:
@@ -98,7 +100,7 @@ class EstateReadiness:
             status = HealthStatus.CRITICAL
             score = 20
         elif estate.beneficiaries_last_reviewed:
-            months_since_review = (date.today() - estate.beneficiaries_last_reviewed).days / 30
+            months_since_review = (self.today - estate.beneficiaries_last_reviewed).days / 30
             if months_since_review <= 12:
                 status = HealthStatus.EXCELLENT
                 score = 100
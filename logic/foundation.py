@@ -36,6 +36,8 @@ class FinancialFoundation:
     
     def __init__(self, client_data: ClientData):
         self.data = client_data
+        # Reference date for time-based metrics, read once per calculator
+        self.today = date.today()
     
     def _estimate_years_until_dependents_independent(self) -> int:
         """
@@ -54,7 +56,7 @@ class FinancialFoundation:
         
         if college_goals:
             latest_goal = max(college_goals, key=lambda g: g.target_date)
-            years_to_college = (latest_goal.target_date - date.today()).days / 365
+            years_to_college = (latest_goal.target_date - self.today).days / 365
             return max(0, int(years_to_college))
         else:
             # Conservative fallback: assume youngest dependent is 5
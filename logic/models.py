@@ -37,9 +37,19 @@ class MetricResult:
     recommendations: List[str] = field(default_factory=list)
     delta: Optional[float] = None  # Absolute change from previous period
     delta_is_positive: Optional[bool] = None  # Whether the delta direction is good
+    delta_format: Optional[str] = None  # 'pct', 'usd' or 'num'; inferred from display_value if omitted
 
+    def __post_init__(self):
+        if self.delta_format is None:
+            if '%' in self.display_value:
+                self.delta_format = 'pct'
+            elif '$' in self.display_value:
+                self.delta_format = 'usd'
+            else:
+                self.delta_format = 'num'
 
-@dataclass
+
+@dataclass(slots=True, frozen=True)
 class ClientProfile:
     """Basic client information."""
     client_id: str
@@ -52,7 +62,7 @@ class ClientProfile:
     state: str
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class IncomeData:
     """Client income information."""
     annual_salary: float
@@ -71,7 +81,7 @@ class IncomeData:
         return self.total_annual_income / 12
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class ExpenseData:
     """Client expense breakdown."""
     housing: float  # Monthly
@@ -117,7 +127,7 @@ class ExpenseData:
         ])
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class AssetData:
     """Client assets breakdown."""
     # Liquid Assets
@@ -173,7 +183,7 @@ class AssetData:
                 self.company_stock_total + self.illiquid_assets)
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class LiabilityData:
     """Client liabilities breakdown."""
     mortgage_primary: float
@@ -199,7 +209,7 @@ class LiabilityData:
         return self.credit_cards + self.personal_loans
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class InsuranceData:
     """Client insurance coverage."""
     life_insurance_coverage: float
@@ -210,7 +220,7 @@ class InsuranceData:
     long_term_care: bool
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class PortfolioAllocation:
     """Investment portfolio allocation."""
     us_stocks: float  # Percentage
@@ -231,7 +241,7 @@ class PortfolioAllocation:
         return self.bonds + self.cash
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class PortfolioMetrics:
     """Additional portfolio metrics."""
     weighted_expense_ratio: float
@@ -241,7 +251,7 @@ class PortfolioMetrics:
     trades_last_12_months: int
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class GoalData:
     """Financial goals."""
     goal_id: str
@@ -253,7 +263,7 @@ class GoalData:
     monthly_contribution: float
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class EstateData:
     """Estate planning information."""
     has_will: bool
@@ -267,7 +277,7 @@ class EstateData:
     digital_estate_documented: bool
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class ClientData:
     """Complete client financial data."""
     profile: ClientProfile
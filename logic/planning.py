@@ -4,7 +4,7 @@ Future Planning & Projections Calculations.
 """
 
 from typing import List, Dict, Optional
-from datetime import date, timedelta
+from datetime import date
 import math
 from .models import ClientData, MetricResult, HealthStatus, GoalData
 
@@ -17,6 +17,8 @@ class FuturePlanning:
     
     def __init__(self, client_data: ClientData):
         self.data = client_data
+        # Reference date for time-based metrics, read once per calculator
+        self.today = date.today()
     
     def retirement_projection(self, 
                               expected_return: float = 0.07,
@@ -163,7 +165,7 @@ class FuturePlanning:
         progress_pct = (goal.current_amount / goal.target_amount) * 100
         
         # Calculate if on track based on time
-        today = date.today()
+        today = self.today
         days_total = (goal.target_date - today).days
         
         if days_total <= 0: